@@ -1,5 +1,6 @@
 # dc003_repo.py — Supabase client version (optional design_id, public schema)
 from __future__ import annotations
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 from db import get_supabase
@@ -23,8 +24,18 @@ print("[dc003_repo] loaded (Supabase) from:", __file__)
 _HAS_DESIGN_ID: Optional[bool] = None
 
 
+@lru_cache(maxsize=1)
+def _pg():
+    """
+    Schema-scoped PostgREST client, built once per process.
+    `.schema()` returns a fresh client (with its own HTTP connection pool) on
+    every call, so caching it lets all DC003 calls reuse pooled connections.
+    """
+    return get_supabase().schema("public")
+
+
 def _tbl():
-    return get_supabase().schema("public").table(TABLE)
+    return _pg().table(TABLE)
 
 
 def _first_or_none(resp):
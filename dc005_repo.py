@@ -1,5 +1,6 @@
 # dc005_repo.py — Supabase client version (optional design_id, public schema)
 from __future__ import annotations
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 from db import get_supabase
@@ -23,8 +24,17 @@ print("[dc005_repo] loaded (Supabase) from:", __file__)
 _HAS_DESIGN_ID: Optional[bool] = None
 
 
+@lru_cache(maxsize=1)
+def _pg():
+    """
+    Schema-scoped PostgREST client, built once per process so every save/list
+    reuses one HTTP connection pool instead of a fresh client per call.
+    """
+    return get_supabase().schema("public")
+
+
 def _tbl():
-    return get_supabase().schema("public").table(TABLE)
+    return _pg().table(TABLE)
 
 
 def _first_or_none(resp):
@@ -71,6 +81,8 @@ def create_dc005_calc(
     design_id: Optional[str] = None,   # optional; used only if column exists
 ) -> str:
     clean_name = (name or "DC005").strip() or "DC005"
+    # `data` goes out as a jsonb dict; supabase-py/httpx encode the request body,
+    # so there is no serializer hook here (payload is ~20 scalars anyway).
     row: Dict[str, Any] = {"user_id": user_id, "name": clean_name, "data": payload}
 
     has_design = _probe_design_id()
@@ -134,6 +146,32 @@ def list_dc005_calcs(user_id: str, limit: int = 100) -> List[Tuple[str, str, Any
     return out
 
 
+# List with payload: one round-trip for the Save/Load panel
+# -> [(id, name, created_at, updated_at, data)]
+def list_dc005_calcs_with_payload(user_id: str, limit: int = 100) -> List[Tuple[str, str, Any, Any, Dict[str, Any]]]:
+    resp = (
+        _tbl()
+        .select("id,name,created_at,updated_at,data")
+        .eq("user_id", user_id)
+        .order("updated_at", desc=True)
+        .order("created_at", desc=True)
+        .limit(int(limit))
+        .execute()
+    )
+    rows = getattr(resp, "data", []) or []
+    out: List[Tuple[str, str, Any, Any, Dict[str, Any]]] = []
+    for r in rows:
+        data = r.get("data")
+        out.append((
+            str(r.get("id")) if r.get("id") is not None else None,
+            r.get("name", ""),
+            r.get("created_at"),
+            r.get("updated_at"),
+            data if isinstance(data, dict) else {},
+        ))
+    return out
+
+
 # -------------------------
 # Get one (user-scoped)
 # -------------------------
@@ -1,11 +1,14 @@
 # page_dc002a.py
 from __future__ import annotations
 import os, math
-from typing import Optional, Any, List, Tuple, Dict
-from PIL import Image
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Optional, Any, List, Tuple, Dict
 import streamlit as st
 from datetime import datetime
 
+if TYPE_CHECKING:  # PIL is imported lazily, only when the sketch is decoded
+    from PIL import Image
+
 # --- auth + repos (for base hydration like DC002) ---
 from auth import require_role, current_user
 from valve_repo import list_valve_designs, get_valve_design
@@ -18,22 +21,26 @@ from dc002a_repo import (
 )
 
 # ---------- Tensile-stress areas (mm²) for common bolt sizes (UNC + a few metric)
-BOLT_TENSILE_AREAS_MM2 = {
+BOLT_TENSILE_AREAS_MM2 = MappingProxyType({
     '1/2" UNC (1/2-13)': 0.1599 * 645.16,   # ≈ 103.2
     '5/8" UNC (5/8-11)': 0.2260 * 645.16,   # ≈ 145.9
     '3/4" UNC (3/4-10)': 0.3340 * 645.16,   # ≈ 215.5
     '7/8" UNC (7/8-9)':  0.4620 * 645.16,   # ≈ 298.1
     '1" UNC (1-8)':      0.6060 * 645.16,   # ≈ 391.0
     'M16 × 2.0': 157.0, 'M20 × 2.5': 245.0, 'M24 × 3.0': 353.0,
-}
+})
 
 # ---------- Bolt materials -> yield strength Syb (MPa)
-BOLT_YIELD_MPA = {
+BOLT_YIELD_MPA = MappingProxyType({
     "A193 B7M": 550.0,   # sheet note
     "A193 B7":  860.0,
     "A320 L7":  620.0,
     "Custom…":  550.0,
-}
+})
+
+# Read-only tables -> option lists built once, reused by the selectboxes
+_BOLT_KEYS = tuple(BOLT_TENSILE_AREAS_MM2)
+_MAT_KEYS = tuple(BOLT_YIELD_MPA)
 
 # ---------- CSS (keep layout consistent: left labels, right inputs)
 ROW_CSS = """
@@ -75,16 +82,32 @@ def _selectbox_with_state(key: str, options, default_index=0):
         return st.selectbox("", options, key=key, label_visibility="collapsed")
     return st.selectbox("", options, index=default_index, key=key, label_visibility="collapsed")
 
+# Resolved once at import; the flange sketch is a static bundled asset
+_FLANGE_PATH = next(
+    (p for p in ("dc002_flange.png", "assets/dc002_flange.png", "static/dc002_flange.png") if os.path.exists(p)),
+    None,
+)
+
+@st.cache_resource(show_spinner=False)
+def _load_flange_img(path: str, size_px: int) -> Image.Image:
+    # decode + Lanczos resample once per process, shared across reruns and sessions
+    from PIL import Image  # lazy: only pay for Pillow when the sketch is actually rendered
+    with Image.open(path) as im:
+        im.load()                             # read pixels now; the file closes on exit
+        img = im if im.mode == "RGBA" else im.convert("RGBA")
+        if img.size != (size_px, size_px):    # skip the Lanczos pass for pre-sized assets
+            img = img.resize((size_px, size_px), Image.LANCZOS)
+        return img
+
 def _show_flange_image(size_px: int = 300):
-    for p in ["dc002_flange.png", "assets/dc002_flange.png", "static/dc002_flange.png"]:
-        if os.path.exists(p):
-            try:
-                img = Image.open(p).convert("RGBA").resize((size_px, size_px), Image.LANCZOS)
-                st.image(img, caption="Body-Closure with bolting", use_column_width=False)
-            except Exception as e:
-                st.warning(f"Could not load flange image ({e}).")
-            return
-    st.info("Add **dc002_flange.png** (or put it in ./assets/ or ./static/) to show the picture here.")
+    if _FLANGE_PATH is None:
+        st.info("Add **dc002_flange.png** (or put it in ./assets/ or ./static/) to show the picture here.")
+        return
+    try:
+        img = _load_flange_img(_FLANGE_PATH, size_px)
+        st.image(img, caption="Body-Closure with bolting", use_column_width=False)
+    except Exception as e:
+        st.warning(f"Could not load flange image ({e}).")
 
 # ---------- repo-shape helpers (same spirit as dc002) ----------
 def _normalize_first_pair(rows: List[Any]) -> Tuple[Optional[str], Optional[str]]:
@@ -104,6 +127,10 @@ def _normalize_first_pair(rows: List[Any]) -> Tuple[Optional[str], Optional[str]
 
 # ---------- base seeding from Valve (wizard-aware + robust, like dc002) ----------
 def _seed_base_from_valve(user_id: Optional[str]):
+    # One-shot: once seeded, skip the whole block on subsequent reruns
+    if st.session_state.get("_dc002a_seeded"):
+        return
+
     # 1) Wizard lock hydration
     if is_locked():
         wb = get_base() or {}
@@ -126,6 +153,7 @@ def _seed_base_from_valve(user_id: Optional[str]):
         for k in ("valve_nps", "valve_asme_class")
     )
     if have_essential:
+        st.session_state["_dc002a_seeded"] = True
         return
 
     # 2) Latest valve design fallback
@@ -148,17 +176,33 @@ def _seed_base_from_valve(user_id: Optional[str]):
         )
         st.session_state.setdefault("active_design_id", vid)
         st.session_state.setdefault("active_design_name", vname)
+        st.session_state["_dc002a_seeded"] = True
     except Exception:
         pass  # quiet fallback
 
+# ---------- numeric kernel (pure, cached on scalar inputs) ----------
+@st.cache_data(show_spinner=False)
+def _compute_dc002a(G: float, Pa_test: float, S: float) -> Dict[str, float]:
+    H = 0.785 * G * G * Pa_test
+    Wm1 = H
+    Am = Wm1 / (S if S else 1e-9)  # mm²
+    return {"H": H, "Wm1": Wm1, "Am": Am}
+
+# ---------- cached backend reads (cleared explicitly at every successful mutation) ----------
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_list(user_id: str):
+    return list_dc002a_calcs(user_id)
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_get(sel_id: str, user_id: str) -> Dict[str, Any]:
+    return get_dc002a_calc(sel_id, user_id) or {}
+
 # ---------- formatting helpers ----------
 def _fmt_num(x: Any, digits: int = 2) -> str:
     if x is None: return "—"
     try:
         f = float(x)
-        if abs(f - round(f)) < 1e-9:
-            return f"{int(round(f))}"
-        return f"{f:.{digits}f}"
+        return str(int(f)) if f.is_integer() else f"{f:.{digits}f}"
     except Exception:
         return str(x)
 
@@ -255,7 +299,7 @@ def render_dc002a():
     # Bolt material / Syb / S
     i = _row("Bolt material =")
     with i:
-        mat = _selectbox_with_state("dc002a_mat", list(BOLT_YIELD_MPA.keys()), default_index=0)
+        mat = _selectbox_with_state("dc002a_mat", _MAT_KEYS, default_index=0)
 
     i = _row("Maximum yield stress at ambient temperature (bolting)  Syb  [MPa]")
     with i:
@@ -274,8 +318,8 @@ def render_dc002a():
     st.markdown("---")
     st.markdown("### DESIGN LOAD")
 
-    H = 0.785 * (G ** 2) * Pa_test
-    Wm1 = H
+    load = _compute_dc002a(float(G), float(Pa_test), float(S))
+    H, Wm1, Am = load["H"], load["Wm1"], load["Am"]
 
     i = _row("Total hydrostatic end force  H  [N] = 0.785 × G² × Pa_test")
     with i:
@@ -287,7 +331,6 @@ def render_dc002a():
     st.markdown("---")
     st.markdown("### BOLTS SECTION CALCULATION")
 
-    Am = Wm1 / (S if S else 1e-9)  # mm²
     i = _row("Limit Stress used for bolts :  S = Sm for ASME VIII Div.2")
     with i:
         _out(f"dc002a_out_S_repeat_{S:.1f}", S, "{:.1f}")
@@ -309,7 +352,7 @@ def render_dc002a():
         _out(f"dc002a_out_areq_{a_req_each:.2f}", a_req_each, "{:,.2f}")
 
     # Select bolt size (closest ≥ a')
-    options = list(BOLT_TENSILE_AREAS_MM2.keys())
+    options = _BOLT_KEYS
     default_idx = 0
     for i_opt, k in enumerate(options):
         if BOLT_TENSILE_AREAS_MM2[k] >= a_req_each:
@@ -390,6 +433,8 @@ def render_dc002a():
         if st.button("💾 Save DC002A", type="primary", key="dc002a_btn_save", use_container_width=True):
             try:
                 new_id = create_dc002a_calc(user_id, save_name, payload)
+                _cached_list.clear()
+                st.session_state["_dc002a_last_saved"] = new_id
                 st.success(f"Saved ✔ (ID: {new_id[:8]}…)")
             except Exception as e:
                 st.error(f"Save failed: {e}")
@@ -416,8 +461,9 @@ def render_dc002a():
         return out
 
     with colR:
-        items_raw = list_dc002a_calcs(user_id)
+        items_raw = _cached_list(user_id)
         items = _normalize_dc002a_list(items_raw)
+        items_by_id = {rid: (nm, ca, ua) for (rid, nm, ca, ua) in items}
         if not items:
             st.info("No DC002A saves yet.")
         else:
@@ -425,10 +471,16 @@ def render_dc002a():
                 f"{nm} ({_id[:8]}…) • Created: {_fmt_dt(ca)} • Updated: {_fmt_dt(ua)}": _id
                 for (_id, nm, ca, ua) in items
             }
+            # Preselect a just-created save (the picker is drawn after the Save button)
+            last_saved = st.session_state.pop("_dc002a_last_saved", None)
+            if last_saved:
+                new_label = next((lbl for lbl, _id in label_to_id.items() if _id == last_saved), None)
+                if new_label:
+                    st.session_state["dc002a_pick"] = new_label
             picked = st.selectbox("My DC002A saves", ["-- none --", *label_to_id.keys()], key="dc002a_pick")
             if picked != "-- none --":
                 sel_id = label_to_id[picked]
-                rec = get_dc002a_calc(sel_id, user_id) or {}
+                rec = _cached_get(sel_id, user_id)
 
                 # pull sections
                 base_s  = rec.get("base") or {}
@@ -436,9 +488,7 @@ def render_dc002a():
                 comp_s  = rec.get("computed") or {}
 
                 # neat meta (some backends return only data; timestamps come from the list)
-                created_at = next((ca for (_i, _n, ca, _u) in items if _i == sel_id), None)
-                updated_at = next((ua for (_i, _n, _c, ua) in items if _i == sel_id), None)
-                name_guess = next((nm for (_i, nm, _c, _u) in items if _i == sel_id), None)
+                name_guess, created_at, updated_at = items_by_id.get(sel_id, (None, None, None))
 
                 st.caption(
                     f"Name: **{(name_guess or 'DC002A')}** • "
@@ -488,6 +538,8 @@ def render_dc002a():
                     newname = st.text_input("Rename", value=(name_guess or "DC002A"), key=f"dc002a_rename_{sel_id}")
                     if st.button("💾 Save name", key=f"dc002a_btn_rename_{sel_id}", use_container_width=True):
                         if update_dc002a_calc(sel_id, user_id, name=newname):
+                            _cached_list.clear()
+                            _cached_get.clear()
                             st.success("Renamed.")
                             st.rerun()
                         else:
@@ -495,25 +547,30 @@ def render_dc002a():
                 with r2:
                     if st.button("🗑️ Delete", key=f"dc002a_btn_delete_{sel_id}", use_container_width=True):
                         if delete_dc002a_calc(sel_id, user_id):
+                            _cached_list.clear()
+                            _cached_get.clear()
                             st.success("Deleted.")
                             st.rerun()
                         else:
                             st.error("Delete failed.")
                 with r3:
                     if st.button("⬅ Load (fill session)", key=f"dc002a_btn_load_{sel_id}", use_container_width=True):
-                        # seed session so reopening shows the same values
-                        st.session_state["dc002a_G"] = ins_s.get("G_mm") or st.session_state.get("dc002a_G")
-                        st.session_state["dc002a_Pa_test"] = ins_s.get("Pa_test_MPa") or st.session_state.get("dc002a_Pa_test")
-                        st.session_state["dc002a_Pe"] = ins_s.get("Pe_MPa") or st.session_state.get("dc002a_Pe")
-                        st.session_state["dc002a_mat"] = ins_s.get("bolt_material") or st.session_state.get("dc002a_mat")
-                        st.session_state["dc002a_Syb"] = ins_s.get("Syb_MPa") or st.session_state.get("dc002a_Syb")
-                        st.session_state["dc002a_n"] = ins_s.get("n") or st.session_state.get("dc002a_n")
-                        st.session_state["dc002a_bolt_sel"] = ins_s.get("bolt_size") or st.session_state.get("dc002a_bolt_sel")
-
-                        st.session_state["operating_pressure_mpa"] = base_s.get("operating_pressure_mpa") or st.session_state.get("operating_pressure_mpa")
-                        st.session_state["valve_nps"] = base_s.get("nps_in") or st.session_state.get("valve_nps")
-                        st.session_state["valve_asme_class"] = base_s.get("asme_class") or st.session_state.get("valve_asme_class")
-                        st.session_state["bore_diameter_mm"] = base_s.get("bore_diameter_mm") or st.session_state.get("bore_diameter_mm")
+                        # seed session so reopening shows the same values (one bulk update)
+                        updates = {
+                            "dc002a_G":         ins_s.get("G_mm"),
+                            "dc002a_Pa_test":   ins_s.get("Pa_test_MPa"),
+                            "dc002a_Pe":        ins_s.get("Pe_MPa"),
+                            "dc002a_mat":       ins_s.get("bolt_material"),
+                            "dc002a_Syb":       ins_s.get("Syb_MPa"),
+                            "dc002a_n":         ins_s.get("n"),
+                            "dc002a_bolt_sel":  ins_s.get("bolt_size"),
+                            "operating_pressure_mpa": base_s.get("operating_pressure_mpa"),
+                            "valve_nps":        base_s.get("nps_in"),
+                            "valve_asme_class": base_s.get("asme_class"),
+                            "bore_diameter_mm": base_s.get("bore_diameter_mm"),
+                        }
+                        st.session_state.update({k: v for k, v in updates.items() if v is not None})
+                        _cached_get.clear()
 
                         st.success("Loaded into session.")
                         st.rerun()
@@ -1,11 +1,14 @@
 # modules/page_dc003.py
 from __future__ import annotations
-import math, os
+import html, math, os
+from contextlib import suppress
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Tuple
 from PIL import Image
 import streamlit as st
 import pandas as pd
 from datetime import datetime
+from types import SimpleNamespace
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Auth + wizard base (same pattern as DC002A)
@@ -14,21 +17,32 @@ from valve_repo import list_valve_designs, get_valve_design
 from wizard_base import get_base, is_locked
 
 # Backend repo for DC003 saves  (PostgreSQL via your dc003_repo.py)
-from dc003_repo import (
-    create_dc003_calc, list_dc003_calcs, get_dc003_calc,
-    update_dc003_calc, delete_dc003_calc
-)
+@st.cache_resource(show_spinner=False)
+def _repo() -> SimpleNamespace:
+    """One process-wide façade over dc003_repo (which holds the pooled client)."""
+    from dc003_repo import (
+        create_dc003_calc, list_dc003_calcs, get_dc003_calc,
+        update_dc003_calc, delete_dc003_calc
+    )
+    return SimpleNamespace(
+        create=create_dc003_calc, list=list_dc003_calcs, get=get_dc003_calc,
+        update=update_dc003_calc, delete=delete_dc003_calc,
+    )
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Reference table (as in your sheet image)
 # Columns: BASE METAL BEARING MATERIAL | MAXIMUM STATIC LOAD (MPa) | MAXIMUM DYNAMIC LOAD (MPa) | MAXIMUM TEMPERATURE (°C)
-BEARING_TABLE = [
-    {"BASE METAL BEARING  MATERIAL": "SS316 + FRICTION COATED",       "MAXIMUM STATIC LOAD (MPa)": 420, "MAXIMUM DYNAMIC LOAD (MPa)": 140, "MAXIMUM TEMPERATURE (°C)": 150},
-    {"BASE METAL BEARING  MATERIAL": "INCONEL 625 + FRICTION COATED", "MAXIMUM STATIC LOAD (MPa)": 240, "MAXIMUM DYNAMIC LOAD (MPa)": 140, "MAXIMUM TEMPERATURE (°C)": 150},
-    {"BASE METAL BEARING  MATERIAL": "MILD STEEL + FRICTION COATED",  "MAXIMUM STATIC LOAD (MPa)": 210, "MAXIMUM DYNAMIC LOAD (MPa)": 140, "MAXIMUM TEMPERATURE (°C)": 150},
-    {"BASE METAL BEARING  MATERIAL": "INCONEL 625 HT",                "MAXIMUM STATIC LOAD (MPa)": 280, "MAXIMUM DYNAMIC LOAD (MPa)": 140, "MAXIMUM TEMPERATURE (°C)": 300},
-    {"BASE METAL BEARING  MATERIAL": "SS316 HT",                      "MAXIMUM STATIC LOAD (MPa)": 240, "MAXIMUM DYNAMIC LOAD (MPa)": 140, "MAXIMUM TEMPERATURE (°C)": 300},
-]
+BEARING_COLUMNS = ("BASE METAL BEARING  MATERIAL", "MAXIMUM STATIC LOAD (MPa)", "MAXIMUM DYNAMIC LOAD (MPa)", "MAXIMUM TEMPERATURE (°C)")
+BEARING_TABLE = (
+    ("SS316 + FRICTION COATED",       420, 140, 150),
+    ("INCONEL 625 + FRICTION COATED", 240, 140, 150),
+    ("MILD STEEL + FRICTION COATED",  210, 140, 150),
+    ("INCONEL 625 HT",                280, 140, 300),
+    ("SS316 HT",                      240, 140, 300),
+)
+
+# Built once at import; st.table only reads it
+_BEARING_DF = pd.DataFrame(BEARING_TABLE, columns=BEARING_COLUMNS)
 
 # ──────────────────────────────────────────────────────────────────────────────
 # CSS + layout helpers (labels left, fields right)
@@ -40,6 +54,11 @@ _ROW_CSS = """
   font-weight:600; color:#0f172a; white-space:nowrap; padding:0 .5rem;
 }
 .row-input{ display:flex; align-items:center; }
+.row-out{ display:grid; grid-template-columns:1.25fr 2.25fr; column-gap:1rem; align-items:center; margin-bottom:1rem; }
+.row-value{
+  height:40px; display:flex; align-items:center; padding:0 .7rem;
+  border-radius:.5rem; background:rgba(151,166,195,.15); color:rgba(49,51,63,.6);
+}
 .stTextInput > div > div > input,
 .stNumberInput > div > div > input{ height:40px !important; padding:0 .7rem !important; }
 .stSelectbox > div > div{ min-height:40px !important; }
@@ -51,6 +70,9 @@ _ROW_CSS = """
 """
 
 def _css():
+    # Must be emitted on every run: Streamlit drops elements a rerun doesn't
+    # re-render, so a once-per-session guard would strip the styles after the
+    # first interaction. The payload is a constant string, so the diff is cheap.
     st.markdown(_ROW_CSS, unsafe_allow_html=True)
 
 def _row(label: str):
@@ -59,29 +81,43 @@ def _row(label: str):
         st.markdown(f"<div class='row-label'>{label}</div>", unsafe_allow_html=True)
     return c2
 
-def _out_calc(key: str, value, fmt: str = "{}"):
+def _out_row(label: str, value, fmt: str = "{}", *, html_value: Optional[str] = None):
     """
-    Render a disabled text field that ALWAYS reflects the latest computed value.
-    We write the formatted value into session_state before drawing the widget.
+    Read-only row (label + value) emitted as ONE markdown element instead of
+    st.columns + label markdown + disabled text_input. Same 1.25 : 2.25 grid.
     """
-    s = fmt.format(value) if value is not None else ""
-    st.session_state[key] = s  # force widget to the latest value
-    st.text_input("", key=key, disabled=True, label_visibility="collapsed")
+    if html_value is None:
+        html_value = "<div class='row-value'>" + html.escape(fmt.format(value) if value is not None else "") + "</div>"
+    st.markdown(
+        f"<div class='row-out'><div class='row-label'>{label}</div><div>{html_value}</div></div>",
+        unsafe_allow_html=True,
+    )
+
+# Static asset location, resolved once at import (no per-rerun stat() probes)
+_BEARING_IMG_PATH = next(
+    (p for p in ("dc003_bearing.png", "assets/dc003_bearing.png", "static/dc003_bearing.png") if os.path.exists(p)),
+    None,
+)
+
+@st.cache_resource(show_spinner=False)
+def _load_bearing_img(path: str, size_px: int) -> Image.Image:
+    # Static asset: decode + resample once per process, share across reruns
+    return Image.open(path).convert("RGBA").resize((size_px, size_px), Image.LANCZOS)
 
 def _show_dc003_image(container, size_px: int = 300):
     # Show sketch in the RIGHT column to preserve layout
-    for p in ["dc003_bearing.png", "assets/dc003_bearing.png", "static/dc003_bearing.png"]:
-        if os.path.exists(p):
-            try:
-                img = Image.open(p).convert("RGBA").resize((size_px, size_px), Image.LANCZOS)
-                with container:
-                    st.image(img, caption="Bearing sketch", use_column_width=False)
-            except Exception as e:
-                with container:
-                    st.warning(f"Couldn't load bearing diagram ({e}).")
-            return
-    with container:
-        st.info("Add **dc003_bearing.png** (or put it in ./assets/ or ./static/) to show the diagram here.")
+    p = _BEARING_IMG_PATH
+    if p is None:
+        with container:
+            st.info("Add **dc003_bearing.png** (or put it in ./assets/ or ./static/) to show the diagram here.")
+        return
+    try:
+        img = _load_bearing_img(p, size_px)
+        with container:
+            st.image(img, caption="Bearing sketch", use_column_width=False)
+    except Exception as e:
+        with container:
+            st.warning(f"Couldn't load bearing diagram ({e}).")
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Wizard hydration helpers (no layout change)
@@ -100,6 +136,10 @@ def _normalize_first_pair(rows: List[Any]) -> Tuple[Optional[str], Optional[str]
     return (str(rid) if rid else None, str(nm) if nm else None)
 
 def _seed_base_from_valve(user_id: Optional[str]):
+    # Run once per session; the Load handler drops the flag to re-hydrate
+    if st.session_state.get("_dc003_seeded"):
+        return
+
     # 1) Wizard lock hydration (pull from wizard_base)
     if is_locked():
         wb = get_base() or {}
@@ -120,13 +160,14 @@ def _seed_base_from_valve(user_id: Optional[str]):
         for k in ("valve_nps", "valve_asme_class")
     )
     if have_essential:
+        st.session_state["_dc003_seeded"] = True
         return
 
     # 2) Fallback to latest valve design
     if not user_id:
         return
     try:
-        rows = list_valve_designs(user_id, limit=1)
+        rows = _cached_list_valve_designs(user_id, limit=1)
         vid, vname = _normalize_first_pair(rows)
         if not vid: return
         vdata = get_valve_design(vid, user_id) or {}
@@ -141,21 +182,86 @@ def _seed_base_from_valve(user_id: Optional[str]):
         )
         st.session_state.setdefault("active_design_id", vid)
         st.session_state.setdefault("active_design_name", vname)
+        st.session_state["_dc003_seeded"] = True
     except Exception:
         pass  # quiet
 
-def _fmt_dt(x: Any) -> str:
-    if not x: return "—"
+# ──────────────────────────────────────────────────────────────────────────────
+# Cached backend reads (cleared by the Save/Rename/Delete handlers)
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_list_dc003(uid: str):
+    return _repo().list(uid)
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_list_valve_designs(uid: str, limit: int = 1):
+    return list_valve_designs(uid, limit=limit)
+
+_DT_FORMATS = ("%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%d %H:%M:%S.%f", "%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S")
+
+@lru_cache(maxsize=2048)
+def _fmt_dt_str(s: str) -> str:
+    base = s[:26]
+    # Fast path: C-level ISO parser; strptime loop only for odd shapes
     try:
-        base = str(x)[:26]
-        for fmt in ("%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%d %H:%M:%S.%f", "%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S"):
-            try:
-                return datetime.strptime(base, fmt).strftime("%Y-%m-%d %H:%M")
-            except Exception:
-                pass
-    except Exception:
+        return datetime.fromisoformat(base.replace("T", " ", 1)).strftime("%Y-%m-%d %H:%M")
+    except ValueError:
         pass
-    return str(x)[:16]
+    for fmt in _DT_FORMATS:
+        with suppress(ValueError):
+            return datetime.strptime(base, fmt).strftime("%Y-%m-%d %H:%M")
+    return s[:16]
+
+def _fmt_dt(x: Any) -> str:
+    if not x: return "—"
+    if isinstance(x, datetime):
+        return x.strftime("%Y-%m-%d %H:%M")
+    return _fmt_dt_str(str(x))
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _history_options(uid: str, items: Tuple[Tuple[str, str, Any, Any], ...]) -> Dict[str, str]:
+    # label -> id for the saves selectbox; rebuilt only when the list changes
+    return {
+        f"{nm} ({_id[:8]}…) • Created: {_fmt_dt(ca)} • Updated: {_fmt_dt(ua)}": _id
+        for (_id, nm, ca, ua) in items
+    }
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _dc003_calc(P: float, Dt: float, Db: float, Hb: float) -> Tuple[float, float]:
+    # Sb = π·Db·Hb ; BBS = π·P·Dt² / (8·Sb)
+    Sb = math.pi * Db * Hb
+    return Sb, (math.pi * P * Dt * Dt) / (8.0 * max(Sb, 1e-9))
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _summary_tables(sel_id: str, updated_at: Any, _rec: Dict[str, Any]) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """
+    Base / Inputs / Computed summary tables for one save. Keyed on
+    (sel_id, updated_at) only — `_rec` is not hashed, since a record does
+    not change without its updated_at changing.
+    """
+    base_s = _rec.get("base") or {}
+    ins_s  = _rec.get("inputs") or {}
+    comp_s = _rec.get("computed") or {}
+    base_df = pd.DataFrame([
+        ["Valve design name", base_s.get("valve_design_name")],
+        ["Valve design ID",   base_s.get("valve_design_id")],
+        ["NPS [in]",          base_s.get("nps_in")],
+        ["ASME Class",        base_s.get("asme_class")],
+        ["Bore (base) [mm]",  base_s.get("bore_diameter_mm")],
+        ["Po (base) [MPa]",   base_s.get("operating_pressure_mpa")],
+    ], columns=["Field", "Value"])
+    ins_df = pd.DataFrame([
+        ["P [MPa]", ins_s.get("P_MPa")],
+        ["Dt [mm]", ins_s.get("Dt_mm")],
+        ["Db [mm]", ins_s.get("Db_mm")],
+        ["Hb [mm]", ins_s.get("Hb_mm")],
+        ["MABS [MPa]", ins_s.get("MABS_MPa")],
+    ], columns=["Field", "Value"])
+    comp_df = pd.DataFrame([
+        ["Sb [mm²]", comp_s.get("Sb_mm2")],
+        ["BBS [MPa]", comp_s.get("BBS_MPa")],
+        ["Check", comp_s.get("verdict")],
+    ], columns=["Field", "Value"])
+    return base_df, ins_df, comp_df
 
 # ──────────────────────────────────────────────────────────────────────────────
 def render_dc003():
@@ -188,13 +294,9 @@ def render_dc003():
             f'Po **{po_txt} MPa**'
         )
 
-    # Read-only headers (use _out_calc so they also update if base changes)
-    i = _row("Nominal Diameter  NPS [in]")
-    with i:
-        _out_calc("dc003_hdr_nps", st.session_state.get("valve_nps", ""), "{}")
-    i = _row("Ansi Class  CLASS")
-    with i:
-        _out_calc("dc003_hdr_asme", st.session_state.get("valve_asme_class", ""), "{}")
+    # Read-only headers (plain HTML rows, so they always reflect the current base)
+    _out_row("Nominal Diameter  NPS [in]", st.session_state.get("valve_nps", ""))
+    _out_row("Ansi Class  CLASS", st.session_state.get("valve_asme_class", ""))
 
     st.markdown("### INPUT DATA")
 
@@ -232,7 +334,7 @@ def render_dc003():
     st.markdown("### MATERIALS")
     i = _row("Material Reference Table")
     with i:
-        st.table(pd.DataFrame(BEARING_TABLE))
+        st.table(_BEARING_DF)
 
     i = _row("Maximum allowable bearing stress  MABS  [MPa]")  # user enters after seeing table
     with i:
@@ -247,28 +349,17 @@ def render_dc003():
     st.markdown("### CALCULATIONS")
 
     # ── Exact sheet formulas (UNCHANGED)
-    Sb  = math.pi * Db * Hb
-    BBS = (math.pi * P * (Dt ** 2)) / (8.0 * max(Sb, 1e-9))
-
-    i = _row("Design bearing surface  Sb  [mm²] = π × Db × Hb")
-    with i:
-        _out_calc("dc003_out_Sb", Sb, "{:.4f}")  # L34
+    Sb, BBS = _dc003_calc(float(P), float(Dt), float(Db), float(Hb))
 
-    i = _row("Bearing stress (1)  BBS  [MPa] = (π × P × Dt²) / (8 × Sb)")
-    with i:
-        _out_calc("dc003_out_BBS", BBS, "{:.2f}")  # sheet formula
-
-    i = _row("Maximum allowable bearing stress  MABS  [MPa]")
-    with i:
-        _out_calc("dc003_out_MABS", MABS, "{:.0f}")
+    _out_row("Design bearing surface  Sb  [mm²] = π × Db × Hb", Sb, "{:.4f}")  # L34
+    _out_row("Bearing stress (1)  BBS  [MPa] = (π × P × Dt²) / (8 × Sb)", BBS, "{:.2f}")  # sheet formula
+    _out_row("Maximum allowable bearing stress  MABS  [MPa]", MABS, "{:.0f}")
 
     verdict = "VERIFIED" if BBS <= MABS else "NOT VERIFIED"
-    i = _row("Check  (BBS ≤ MABS)")
-    with i:
-        st.markdown(
-            f"<span class='badge {'ok' if verdict=='VERIFIED' else 'bad'}'>{verdict}</span>",
-            unsafe_allow_html=True
-        )
+    _out_row(
+        "Check  (BBS ≤ MABS)", verdict,
+        html_value=f"<span class='badge {'ok' if verdict=='VERIFIED' else 'bad'}'>{verdict}</span>",
+    )
 
     # Persist to session (for later steps/pages)
     st.session_state["dc003"] = {
@@ -285,30 +376,30 @@ def render_dc003():
         st.info("Log in to save your DC003 calculations.")
         return
 
-    # Build payload (Base + Inputs + Computed)
-    base_payload: Dict[str, Any] = {
-        "valve_design_id":   st.session_state.get("active_design_id"),
-        "valve_design_name": st.session_state.get("active_design_name"),
-        "nps_in":            st.session_state.get("valve_nps"),
-        "asme_class":        st.session_state.get("valve_asme_class"),
-        "bore_diameter_mm":  st.session_state.get("bore_diameter_mm"),
-        "operating_pressure_mpa": st.session_state.get("operating_pressure_mpa"),
-    }
-    inputs_payload: Dict[str, Any] = {
-        "P_MPa": P, "Dt_mm": Dt, "Db_mm": Db, "Hb_mm": Hb, "MABS_MPa": MABS
-    }
-    computed_payload: Dict[str, Any] = {
-        "Sb_mm2": Sb, "BBS_MPa": BBS, "verdict": verdict
-    }
-    payload: Dict[str, Any] = {"base": base_payload, "inputs": inputs_payload, "computed": computed_payload}
-
     colL, colR = st.columns([1.2, 1.8])
     with colL:
         default_name = f"DC003_{st.session_state.get('active_design_name') or 'calc'}"
         save_name = st.text_input("Save as name", value=default_name, key="dc003_save_name")
         if st.button("💾 Save DC003", type="primary", key="dc003_btn_save", use_container_width=True):
+            # Build payload (Base + Inputs + Computed) only when actually saving
+            base_payload: Dict[str, Any] = {
+                "valve_design_id":   st.session_state.get("active_design_id"),
+                "valve_design_name": st.session_state.get("active_design_name"),
+                "nps_in":            st.session_state.get("valve_nps"),
+                "asme_class":        st.session_state.get("valve_asme_class"),
+                "bore_diameter_mm":  st.session_state.get("bore_diameter_mm"),
+                "operating_pressure_mpa": st.session_state.get("operating_pressure_mpa"),
+            }
+            inputs_payload: Dict[str, Any] = {
+                "P_MPa": P, "Dt_mm": Dt, "Db_mm": Db, "Hb_mm": Hb, "MABS_MPa": MABS
+            }
+            computed_payload: Dict[str, Any] = {
+                "Sb_mm2": Sb, "BBS_MPa": BBS, "verdict": verdict
+            }
+            payload: Dict[str, Any] = {"base": base_payload, "inputs": inputs_payload, "computed": computed_payload}
             try:
-                new_id = create_dc003_calc(user_id, save_name, payload)
+                new_id = _repo().create(user_id, save_name, payload)
+                _cached_list_dc003.clear()
                 st.success(f"Saved ✔ (ID: {new_id[:8]}…)")
             except Exception as e:
                 st.error(f"Save failed: {e}")
@@ -334,37 +425,32 @@ def render_dc003():
         return out
 
     with colR:
-        items_raw = list_dc003_calcs(user_id)
+        items_raw = _cached_list_dc003(user_id)
         items = _normalize_dc003_list(items_raw)
+        items_by_id = {rid: (nm, ca, ua) for (rid, nm, ca, ua) in items}
 
         # Optional: small table to visualize PG-backed history
         if items:
-            hist_df = pd.DataFrame(
-                [{"ID": _id, "Name": nm, "Created": _fmt_dt(ca), "Updated": _fmt_dt(ua)} for (_id, nm, ca, ua) in items]
-            )
+            hist_df = pd.DataFrame.from_records(items, columns=["ID", "Name", "Created", "Updated"])
+            hist_df["Created"] = hist_df["Created"].map(_fmt_dt)
+            hist_df["Updated"] = hist_df["Updated"].map(_fmt_dt)
             st.dataframe(hist_df, use_container_width=True, hide_index=True)
 
         if not items:
             st.info("No DC003 saves yet.")
         else:
-            label_to_id = {
-                f"{nm} ({_id[:8]}…) • Created: {_fmt_dt(ca)} • Updated: {_fmt_dt(ua)}": _id
-                for (_id, nm, ca, ua) in items
-            }
+            label_to_id = _history_options(user_id, tuple(items))
             picked = st.selectbox("My DC003 saves", ["-- none --", *label_to_id.keys()], key="dc003_pick")
             if picked != "-- none --":
                 sel_id = label_to_id[picked]
-                rec = get_dc003_calc(sel_id, user_id) or {}
+                rec = _repo().get(sel_id, user_id) or {}
 
                 # pull sections
                 base_s  = rec.get("base") or {}
                 ins_s   = rec.get("inputs") or {}
-                comp_s  = rec.get("computed") or {}
 
                 # neat meta (some backends return only data; timestamps come from the list)
-                created_at = next((ca for (_i, _n, ca, _u) in items if _i == sel_id), None)
-                updated_at = next((ua for (_i, _n, _c, ua) in items if _i == sel_id), None)
-                name_guess = next((nm for (_i, nm, _c, _u) in items if _i == sel_id), None)
+                name_guess, created_at, updated_at = items_by_id.get(sel_id, (None, None, None))
 
                 st.caption(
                     f"Name: **{(name_guess or 'DC003')}** • "
@@ -373,45 +459,31 @@ def render_dc003():
                 )
 
                 st.markdown("#### Summary (Prettified)")
+                base_df, ins_df, comp_df = _summary_tables(sel_id, updated_at, rec)
                 st.markdown("**Base (from Valve Data)**")
-                st.table(pd.DataFrame([
-                    ["Valve design name", base_s.get("valve_design_name")],
-                    ["Valve design ID",   base_s.get("valve_design_id")],
-                    ["NPS [in]",          base_s.get("nps_in")],
-                    ["ASME Class",        base_s.get("asme_class")],
-                    ["Bore (base) [mm]",  base_s.get("bore_diameter_mm")],
-                    ["Po (base) [MPa]",   base_s.get("operating_pressure_mpa")],
-                ], columns=["Field", "Value"]))
+                st.table(base_df)
 
                 st.markdown("**Inputs**")
-                st.table(pd.DataFrame([
-                    ["P [MPa]", ins_s.get("P_MPa")],
-                    ["Dt [mm]", ins_s.get("Dt_mm")],
-                    ["Db [mm]", ins_s.get("Db_mm")],
-                    ["Hb [mm]", ins_s.get("Hb_mm")],
-                    ["MABS [MPa]", ins_s.get("MABS_MPa")],
-                ], columns=["Field", "Value"]))
+                st.table(ins_df)
 
                 st.markdown("**Computed**")
-                st.table(pd.DataFrame([
-                    ["Sb [mm²]", comp_s.get("Sb_mm2")],
-                    ["BBS [MPa]", comp_s.get("BBS_MPa")],
-                    ["Check", comp_s.get("verdict")],
-                ], columns=["Field", "Value"]))
+                st.table(comp_df)
 
                 # ---------- Actions ----------
                 r1, r2, r3 = st.columns(3)
                 with r1:
                     newname = st.text_input("Rename", value=(name_guess or "DC003"), key=f"dc003_rename_{sel_id}")
                     if st.button("💾 Save name", key=f"dc003_btn_rename_{sel_id}", use_container_width=True):
-                        if update_dc003_calc(sel_id, user_id, name=newname):
+                        if _repo().update(sel_id, user_id, name=newname):
+                            _cached_list_dc003.clear()
                             st.success("Renamed.")
                             st.rerun()
                         else:
                             st.error("Rename failed.")
                 with r2:
                     if st.button("🗑️ Delete", key=f"dc003_btn_delete_{sel_id}", use_container_width=True):
-                        if delete_dc003_calc(sel_id, user_id):
+                        if _repo().delete(sel_id, user_id):
+                            _cached_list_dc003.clear()
                             st.success("Deleted.")
                             st.rerun()
                         else:
@@ -429,6 +501,7 @@ def render_dc003():
                         st.session_state["valve_nps"] = base_s.get("nps_in") or st.session_state.get("valve_nps")
                         st.session_state["valve_asme_class"] = base_s.get("asme_class") or st.session_state.get("valve_asme_class")
                         st.session_state["bore_diameter_mm"] = base_s.get("bore_diameter_mm") or st.session_state.get("bore_diameter_mm")
+                        st.session_state.pop("_dc003_seeded", None)
 
                         st.success("Loaded into session.")
                         st.rerun()
@@ -1,6 +1,8 @@
 # page_dc004.py
 from __future__ import annotations
-import os
+import html, os
+from math import isnan, nan
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 from PIL import Image
 import streamlit as st
@@ -27,6 +29,11 @@ _ROW_CSS = """
   font-weight:600; color:#0f172a; white-space:nowrap; padding:0 .5rem;
 }
 .row-input{ display:flex; align-items:center; }
+.row-out{ display:grid; grid-template-columns:1.25fr 2.25fr; column-gap:1rem; align-items:center; margin-bottom:1rem; }
+.row-value{
+  height:40px; display:flex; align-items:center; padding:0 .7rem;
+  border-radius:.5rem; background:rgba(151,166,195,.15); color:rgba(49,51,63,.6);
+}
 .stTextInput > div > div > input,
 .stNumberInput > div > div > input{ height:40px !important; padding:0 .7rem !important; }
 .stSelectbox > div > div{ min-height:40px !important; }
@@ -37,7 +44,14 @@ _ROW_CSS = """
 </style>
 """
 
+# Only two possible verdict badges: build them once
+_BADGE_OK  = "<span class='badge ok' style='margin-left:.6rem;'>VERIFIED</span>"
+_BADGE_BAD = "<span class='badge bad' style='margin-left:.6rem;'>NOT VERIFIED</span>"
+
 def _css():
+    # Emitted on every run on purpose: Streamlit removes elements a rerun does
+    # not re-render, so a once-per-session flag would drop the styles after
+    # the first interaction (see page_dc003._css).
     st.markdown(_ROW_CSS, unsafe_allow_html=True)
 
 def _row(label: str):
@@ -46,63 +60,113 @@ def _row(label: str):
         st.markdown(f"<div class='row-label'>{label}</div>", unsafe_allow_html=True)
     return c2
 
-def _out_calc(key: str, value, fmt: str = "{}"):
+def _out_row(label: str, value, fmt: str = "{}", *, html_value: Optional[str] = None):
     """
-    Render a disabled text field that ALWAYS reflects the latest computed value.
-    We write the formatted value into session_state before drawing the widget.
+    Read-only row (label + value) emitted as ONE markdown element instead of
+    st.columns + label markdown + disabled text_input. Same 1.25 : 2.25 grid.
     """
-    s = fmt.format(value) if value is not None else ""
-    st.session_state[key] = s
-    st.text_input("", key=key, disabled=True, label_visibility="collapsed")
+    if html_value is None:
+        html_value = "<div class='row-value'>" + html.escape(fmt.format(value) if value is not None else "") + "</div>"
+    st.markdown(
+        f"<div class='row-out'><div class='row-label'>{label}</div><div>{html_value}</div></div>",
+        unsafe_allow_html=True,
+    )
 
-def _show_dc004_image(container, size_px: int = 300):
-    for p in ["dc004_seat_section.png", "assets/dc004_seat_section.png", "static/dc004_seat_section.png"]:
+@st.cache_resource(show_spinner=False)
+def _load_dc004_image(path: str, size_px: int, mtime: float) -> Image.Image:
+    # mtime is part of the key so an updated PNG is picked up without a restart
+    img = Image.open(path)
+    img.draft("RGB", (size_px * 2, size_px * 2))  # reduced-scale decode where the codec supports it (JPEG)
+    if img.mode not in ("RGB", "RGBA"):
+        img = img.convert("RGBA")
+    img.thumbnail((size_px, size_px), Image.Resampling.LANCZOS)
+    return img
+
+@lru_cache(maxsize=1)
+def _dc004_image_path() -> Optional[str]:
+    # Assets don't move at runtime: probe the candidates once per process
+    for p in ("dc004_seat_section.png", "assets/dc004_seat_section.png", "static/dc004_seat_section.png"):
         if os.path.exists(p):
-            try:
-                img = Image.open(p).convert("RGBA").resize((size_px, size_px), Image.LANCZOS)
-                with container:
-                    st.image(img, caption="Seat section / load sketch", use_column_width=False)
-            except Exception as e:
-                with container:
-                    st.warning(f"Could not load DC004 diagram ({e}).")
-            return
-    with container:
-        st.info("Add **dc004_seat_section.png** (or put it in ./assets/ or ./static/) to show the sketch here.")
+            return p
+    return None
+
+def _show_dc004_image(container, size_px: int = 300):
+    p = _dc004_image_path()
+    if p is None:
+        with container:
+            st.info("Add **dc004_seat_section.png** (or put it in ./assets/ or ./static/) to show the sketch here.")
+        return
+    try:
+        img = _load_dc004_image(p, size_px, os.stat(p).st_mtime)
+        with container:
+            st.image(img, caption="Seat section / load sketch", use_column_width=False)
+    except Exception as e:
+        with container:
+            st.warning(f"Could not load DC004 diagram ({e}).")
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Wizard hydration helpers (same as other pages)
+# Row readers keyed by exact type: one dict lookup instead of an isinstance chain.
+def _first_from_seq(r) -> Tuple[Any, Any]:
+    rid = r[0] if len(r) >= 1 else None
+    nm = r[1] if len(r) >= 2 and r[1] not in (None, "") else "Untitled"
+    return rid, nm
+
+def _first_from_dict(r) -> Tuple[Any, Any]:
+    rid = r.get("id") or r.get("design_id") or r.get("calc_id") or r.get("id_")
+    return rid, r.get("name") or r.get("title") or "Untitled"
+
+def _first_from_str(r) -> Tuple[Any, Any]:
+    return r, "Untitled"
+
+_FIRST_PAIR_READERS = {list: _first_from_seq, tuple: _first_from_seq, dict: _first_from_dict, str: _first_from_str}
+
+def _reader_for(readers: Dict[type, Any], obj: Any):
+    fn = readers.get(type(obj))
+    if fn is None:  # subclasses (namedtuple, OrderedDict, …) take the slow path
+        fn = next((f for t, f in readers.items() if isinstance(obj, t)), None)
+    return fn
+
+def _first_pair_of(first: Any) -> Tuple[Optional[str], Optional[str]]:
+    fn = _reader_for(_FIRST_PAIR_READERS, first)
+    rid, nm = fn(first) if fn else (None, "Untitled")
+    return (str(rid) if rid else None, str(nm) if nm else None)
+
 def _normalize_first_pair(rows: List[Any]) -> Tuple[Optional[str], Optional[str]]:
     if not rows: return None, None
-    first = rows[0]
-    rid, nm = None, "Untitled"
-    if isinstance(first, (list, tuple)):
-        if len(first) >= 1: rid = first[0]
-        if len(first) >= 2 and first[1] not in (None, ""): nm = first[1]
-    elif isinstance(first, dict):
-        rid = first.get("id") or first.get("design_id") or first.get("calc_id") or first.get("id_")
-        nm = first.get("name") or first.get("title") or nm
-    elif isinstance(first, str):
-        rid = first
-    return (str(rid) if rid else None, str(nm) if nm else None)
+    return _first_pair_of(rows[0])
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_latest_valve(user_id: str) -> Dict[str, Any]:
+    """Latest valve design for the user (id, name, data) as one plain dict."""
+    rows = list_valve_designs(user_id, limit=1)
+    vid, vname = _normalize_first_pair(rows)
+    vdata = (get_valve_design(vid, user_id) or {}) if vid else {}
+    return {"vid": vid, "vname": vname, "vdata": vdata}
 
 def _seed_base_from_valve(user_id: Optional[str]):
+    # Warm rerun: essentials already in session and no wizard base to merge
+    ss = st.session_state
+    if ss.get("valve_nps") and ss.get("valve_asme_class") and not is_locked():
+        return
+
     # 1) If wizard is locked, hydrate from wizard_base
     if is_locked():
         wb = get_base() or {}
-        st.session_state.setdefault("valve_nps", wb.get("nps_in"))
-        st.session_state.setdefault("valve_asme_class", wb.get("asme_class"))
+        ss.setdefault("valve_nps", wb.get("nps_in"))
+        ss.setdefault("valve_asme_class", wb.get("asme_class"))
         if wb.get("bore_diameter_mm") is not None:
-            st.session_state.setdefault("bore_diameter_mm", wb.get("bore_diameter_mm"))
+            ss.setdefault("bore_diameter_mm", wb.get("bore_diameter_mm"))
         if wb.get("operating_pressure_mpa") is not None:
-            st.session_state.setdefault("operating_pressure_mpa", wb.get("operating_pressure_mpa"))
+            ss.setdefault("operating_pressure_mpa", wb.get("operating_pressure_mpa"))
         if wb.get("design_id"):
-            st.session_state.setdefault("active_design_id", wb.get("design_id"))
+            ss.setdefault("active_design_id", wb.get("design_id"))
         if wb.get("name"):
-            st.session_state.setdefault("active_design_name", wb.get("name"))
+            ss.setdefault("active_design_name", wb.get("name"))
 
     # If essential bits exist, done
     have_essential = all(
-        st.session_state.get(k) not in (None, "", 0)
+        ss.get(k) not in (None, "", 0)
         for k in ("valve_nps", "valve_asme_class")
     )
     if have_essential:
@@ -112,39 +176,126 @@ def _seed_base_from_valve(user_id: Optional[str]):
     if not user_id:
         return
     try:
-        rows = list_valve_designs(user_id, limit=1)
-        vid, vname = _normalize_first_pair(rows)
+        latest = _fetch_latest_valve(user_id)
+        vid, vname = latest["vid"], latest["vname"]
         if not vid: return
-        vdata = get_valve_design(vid, user_id) or {}
+        vdata = latest["vdata"]
         vcalc = vdata.get("calculated") or {}
 
-        st.session_state.setdefault("valve_nps", vdata.get("nps_in"))
-        st.session_state.setdefault("valve_asme_class", vdata.get("asme_class"))
-        st.session_state.setdefault("bore_diameter_mm", vcalc.get("bore_diameter_mm"))
-        st.session_state.setdefault(
+        ss.setdefault("valve_nps", vdata.get("nps_in"))
+        ss.setdefault("valve_asme_class", vdata.get("asme_class"))
+        ss.setdefault("bore_diameter_mm", vcalc.get("bore_diameter_mm"))
+        ss.setdefault(
             "operating_pressure_mpa",
             vcalc.get("operating_pressure_mpa") or vdata.get("calc_operating_pressure_mpa")
         )
-        st.session_state.setdefault("active_design_id", vid)
-        st.session_state.setdefault("active_design_name", vname)
+        ss.setdefault("active_design_id", vid)
+        ss.setdefault("active_design_name", vname)
     except Exception:
         pass
 
+_DT_FORMATS = ("%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%d %H:%M:%S.%f", "%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S")
+
 def _fmt_dt(x: Any) -> str:
     if not x: return "—"
+    s = str(x)
+    # Fast path: C-level ISO parser (handles offsets; 'Z' normalized for older Pythons)
+    try:
+        return datetime.fromisoformat(s.replace("Z", "+00:00")).strftime("%Y-%m-%d %H:%M")
+    except ValueError:
+        pass
     try:
-        base = str(x)[:26]
-        for fmt in ("%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%d %H:%M:%S.%f", "%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S"):
+        base = s[:26]
+        for fmt in _DT_FORMATS:
             try:
                 return datetime.strptime(base, fmt).strftime("%Y-%m-%d %H:%M")
             except Exception:
                 pass
     except Exception:
         pass
-    return str(x)[:16]
+    return s[:16]
+
+def _row_from_seq(r) -> Tuple[Any, Any, Any, Any]:
+    n = len(r)
+    return (
+        r[0] if n >= 1 else None,
+        r[1] if n >= 2 and r[1] not in (None, "") else "Untitled",
+        r[2] if n >= 3 else None,
+        r[3] if n >= 4 else None,
+    )
+
+def _row_from_dict(r) -> Tuple[Any, Any, Any, Any]:
+    return (
+        r.get("id") or r.get("calc_id") or r.get("id_"),
+        r.get("name") or "Untitled",
+        r.get("created_at"),
+        r.get("updated_at"),
+    )
+
+def _row_from_str(r) -> Tuple[Any, Any, Any, Any]:
+    return r, "Untitled", None, None
+
+_LIST_ROW_READERS = {list: _row_from_seq, tuple: _row_from_seq, dict: _row_from_dict, str: _row_from_str}
+
+def _normalize_dc004_list(rows: List[Any]) -> List[Tuple[str, str, Any, Any]]:
+    out: List[Tuple[str, str, Any, Any]] = []
+    for r in rows or []:
+        fn = _reader_for(_LIST_ROW_READERS, r)
+        if fn is None:
+            continue
+        rid, nm, ca, ua = fn(r)
+        if rid:
+            out.append((str(rid), str(nm), ca, ua))
+    return out
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_dc004_list(user_id: str) -> List[Tuple[str, str, Any, Any]]:
+    # Cleared after every successful save / rename / delete
+    return _normalize_dc004_list(list_dc004_calcs(user_id))
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_get_dc004(sel_id: str, user_id: str) -> Dict[str, Any]:
+    return get_dc004_calc(sel_id, user_id) or {}
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Save-panel action callbacks (outcome shown via a one-shot "_dc004_flash")
+def _on_rename_dc004(sel_id: str, user_id: str):
+    newname = st.session_state.get(f"dc004_rename_{sel_id}") or "DC004"
+    if update_dc004_calc(sel_id, user_id, name=newname):
+        _cached_dc004_list.clear()
+        _cached_get_dc004.clear()
+        st.session_state["_dc004_flash"] = ("success", "Renamed.")
+    else:
+        st.session_state["_dc004_flash"] = ("error", "Rename failed.")
+
+def _on_delete_dc004(sel_id: str, user_id: str):
+    if delete_dc004_calc(sel_id, user_id):
+        _cached_dc004_list.clear()
+        _cached_get_dc004.clear()
+        st.session_state["dc004_pick"] = "-- none --"
+        st.session_state["_dc004_flash"] = ("success", "Deleted.")
+    else:
+        st.session_state["_dc004_flash"] = ("error", "Delete failed.")
+
+def _on_load_dc004(ins_s: Dict[str, Any], base_s: Dict[str, Any]):
+    ss = st.session_state
+    # restore inputs to session
+    ss["dc004_SmF316"] = ins_s.get("SmF316_MPa") or ss.get("dc004_SmF316")
+    ss["dc004_SaF316"] = ins_s.get("SaF316_MPa") or ss.get("dc004_SaF316")
+    ss["dc004_Di"] = ins_s.get("Di_mm") or ss.get("dc004_Di")
+    ss["dc004_P"]  = ins_s.get("P_MPa") or ss.get("dc004_P")
+    ss["dc004_PT"] = ins_s.get("PT_MPa") or ss.get("dc004_PT")
+
+    # also refresh base
+    ss["operating_pressure_mpa"] = base_s.get("operating_pressure_mpa") or ss.get("operating_pressure_mpa")
+    ss["valve_nps"] = base_s.get("nps_in") or ss.get("valve_nps")
+    ss["valve_asme_class"] = base_s.get("asme_class") or ss.get("valve_asme_class")
+    ss["bore_diameter_mm"] = base_s.get("bore_diameter_mm") or ss.get("bore_diameter_mm")
+    ss["_dc004_flash"] = ("success", "Loaded into session.")
 
 # ──────────────────────────────────────────────────────────────────────────────
 def render_dc004():
+    ss = st.session_state
     # Access guard + base hydration (no layout change)
     require_role(["user", "superadmin"])
     user = current_user() or {}
@@ -158,45 +309,47 @@ def render_dc004():
     st.markdown("---")
 
     # Header (from Valve page if available) — read-only on right
-    i = _row("NPS")
-    with i:
-        _out_calc("dc004_hdr_nps", st.session_state.get("valve_nps", ""), "{}")
-    i = _row("Valve Class")
-    with i:
-        _out_calc("dc004_hdr_asme", st.session_state.get("valve_asme_class", ""), "{}")
+    _out_row("NPS", ss.get("valve_nps", ""))
+    _out_row("Valve Class", ss.get("valve_asme_class", ""))
 
     st.markdown("### INPUT DATA")
 
-    # Allowables (editable)
-    i = _row("LIMIT VALUES — ASME VIII, Div.2  SmF316 [MPa]")
-    with i:
-        SmF316 = st.number_input("", value=138.0, step=1.0, format="%.0f",
-                                 key="dc004_SmF316", label_visibility="collapsed")
-    i = _row("LIMIT VALUES — ASME VIII, Div.1  SaF316 [MPa]")
-    with i:
-        SaF316 = st.number_input("", value=138.0, step=1.0, format="%.0f",
-                                 key="dc004_SaF316", label_visibility="collapsed")
-
-    # Sketch/image aligned to layout
-    i = _row("Sketch")
-    _show_dc004_image(i, size_px=300)
-
-    # Geometry & pressures (editable)
-    P_default  = float(st.session_state.get("operating_pressure_mpa", 10.21))
-    Di_default = float(st.session_state.get("bore_diameter_mm", 51.00))
-
-    i = _row("INTERNAL SEAT DIAM.  Di [mm]")
-    with i:
-        Di = st.number_input("", value=Di_default, step=0.01, format="%.2f",
-                             key="dc004_Di", label_visibility="collapsed")
-    i = _row("DESIGN PRESSURE  P [MPa]")
-    with i:
-        P  = st.number_input("", value=P_default, step=0.01, format="%.2f",
-                             key="dc004_P", label_visibility="collapsed")
-    i = _row("SEAT TEST PRESSURE  PT = 1.1 × P [MPa]")
-    with i:
-        PT = st.number_input("", value=round(1.1 * P, 2), step=0.01, format="%.2f",
-                             key="dc004_PT", label_visibility="collapsed")
+    # One form for all inputs: edits are applied together on "Recalculate"
+    # instead of rerunning the whole page on every keystroke.
+    with st.form("dc004_inputs", clear_on_submit=False, border=False):
+        # Allowables (editable)
+        i = _row("LIMIT VALUES — ASME VIII, Div.2  SmF316 [MPa]")
+        with i:
+            SmF316 = st.number_input("", value=138.0, step=1.0, format="%.0f",
+                                     key="dc004_SmF316", label_visibility="collapsed")
+        i = _row("LIMIT VALUES — ASME VIII, Div.1  SaF316 [MPa]")
+        with i:
+            SaF316 = st.number_input("", value=138.0, step=1.0, format="%.0f",
+                                     key="dc004_SaF316", label_visibility="collapsed")
+
+        # Sketch/image aligned to layout
+        i = _row("Sketch")
+        _show_dc004_image(i, size_px=300)
+
+        # Geometry & pressures (editable)
+        P_default  = float(ss.get("operating_pressure_mpa", 10.21))
+        Di_default = float(ss.get("bore_diameter_mm", 51.00))
+
+        i = _row("INTERNAL SEAT DIAM.  Di [mm]")
+        with i:
+            Di = st.number_input("", value=Di_default, step=0.01, format="%.2f",
+                                 key="dc004_Di", label_visibility="collapsed")
+        i = _row("DESIGN PRESSURE  P [MPa]")
+        with i:
+            P  = st.number_input("", value=P_default, step=0.01, format="%.2f",
+                                 key="dc004_P", label_visibility="collapsed")
+        i = _row("SEAT TEST PRESSURE  PT = 1.1 × P [MPa]")
+        with i:
+            PT = st.number_input("", value=round(1.1 * P, 2), step=0.01, format="%.2f",
+                                 key="dc004_PT", label_visibility="collapsed")
+        i = _row("")
+        with i:
+            st.form_submit_button("Recalculate")
 
     st.markdown("---")
 
@@ -205,49 +358,48 @@ def render_dc004():
     st.caption("MINIMUM THK. FOR F316 MATERIAL")
     denom_d1 = 2.0 * (SaF316 - 0.6 * P)
     t_design = (P * Di) / denom_d1 if denom_d1 > 0 else float("nan")
-    i = _row("t = ( P × Di ) / ( 2 × ( SaF316 − 0.6 × P ) )")
-    with i:
-        _out_calc("dc004_t_design", t_design, "{:.2f}")
+    _out_row("t = ( P × Di ) / ( 2 × ( SaF316 − 0.6 × P ) )", t_design, "{:.2f}")
 
     # SEAT TEST CONDITION — Div.2 (dynamic)
     st.markdown("#### SEAT TEST CONDITION: ASME VIII, DIV.2 — Ed.2023")
     st.caption("MINIMUM THK. FOR F316 MATERIAL")
     denom_d2 = 2.0 * (SmF316 - 0.6 * PT)
     t_test = (PT * Di) / denom_d2 if denom_d2 > 0 else float("nan")
-    i = _row("t = ( PT × Di ) / ( 2 × ( SmF316 − 0.6 × PT ) )")
-    with i:
-        _out_calc("dc004_t_test", t_test, "{:.2f}")
+    _out_row("t = ( PT × Di ) / ( 2 × ( SmF316 − 0.6 × PT ) )", t_test, "{:.2f}")
 
     st.markdown("---")
 
     # Real thickness (kept read-only as in your file)
     real_t = 6.90
-    i = _row("REAL THICKNESS  [mm]")
-    with i:
-        _out_calc("dc004_real_t", real_t, "{:.2f}")
+    _out_row("REAL THICKNESS  [mm]", real_t, "{:.2f}")
 
     # Required & verdict (unchanged logic)
-    req_t  = max(t_design, t_test)
-    is_nan = (req_t != req_t)  # NaN check
+    if isnan(t_design) or isnan(t_test):
+        req_t, is_nan = nan, True
+    else:
+        req_t, is_nan = (t_design if t_design > t_test else t_test), False
     verdict = "VERIFIED" if (not is_nan) and real_t >= req_t else "NOT VERIFIED"
 
-    i = _row("Check")
-    with i:
-        st.markdown(
+    _out_row(
+        "Check", verdict,
+        html_value=(
             f"<div>Required minimum thickness = <b>{(0 if is_nan else req_t):.2f} mm</b> "
-            f"<span class='badge {'ok' if verdict=='VERIFIED' else 'bad'}' style='margin-left:.6rem;'>{verdict}</span></div>",
-            unsafe_allow_html=True
-        )
+            f"{_BADGE_OK if verdict == 'VERIFIED' else _BADGE_BAD}</div>"
+        ),
+    )
 
     st.caption("Dimensions in mm · Pressure in MPa")
 
-    # persist (useful for other sheets)
-    st.session_state["dc004"] = {
-        "Di_mm": Di, "P_MPa": P, "PT_MPa": PT,
-        "SaF316_MPa": SaF316, "SmF316_MPa": SmF316,
-        "t_design_mm": t_design, "t_test_mm": t_test,
-        "real_t_mm": real_t, "required_t_mm": req_t, "verdict": verdict,
-    }
+    # persist (useful for other sheets) — only when the inputs actually changed
+    input_key = (SmF316, SaF316, Di, P, PT)
+    if ss.get("_dc004_input_key") != input_key or "dc004" not in ss:
+        ss["dc004"] = {
+            "Di_mm": Di, "P_MPa": P, "PT_MPa": PT,
+            "SaF316_MPa": SaF316, "SmF316_MPa": SmF316,
+            "t_design_mm": t_design, "t_test_mm": t_test,
+            "real_t_mm": real_t, "required_t_mm": req_t, "verdict": verdict,
+        }
+        ss["_dc004_input_key"] = input_key
 
     # ───────────────────────── Save / Load (backend) ──────────────────────────
     st.markdown("---")
@@ -257,150 +409,99 @@ def render_dc004():
         st.info("Log in to save your DC004 calculations.")
         return
 
-    # Build payload (Base + Inputs + Computed)
-    base_payload: Dict[str, Any] = {
-        "valve_design_id":   st.session_state.get("active_design_id"),
-        "valve_design_name": st.session_state.get("active_design_name"),
-        "nps_in":            st.session_state.get("valve_nps"),
-        "asme_class":        st.session_state.get("valve_asme_class"),
-        "bore_diameter_mm":  st.session_state.get("bore_diameter_mm"),
-        "operating_pressure_mpa": st.session_state.get("operating_pressure_mpa"),
-    }
-    inputs_payload: Dict[str, Any] = {
-        "SmF316_MPa": SmF316, "SaF316_MPa": SaF316,
-        "Di_mm": Di, "P_MPa": P, "PT_MPa": PT, "real_t_mm": real_t
-    }
-    computed_payload: Dict[str, Any] = {
-        "t_design_mm": t_design, "t_test_mm": t_test,
-        "required_t_mm": req_t, "verdict": verdict
-    }
-    payload: Dict[str, Any] = {"base": base_payload, "inputs": inputs_payload, "computed": computed_payload}
-
     colL, colR = st.columns([1.2, 1.8])
     with colL:
-        default_name = f"DC004_{st.session_state.get('active_design_name') or 'calc'}"
+        default_name = f"DC004_{ss.get('active_design_name') or 'calc'}"
         save_name = st.text_input("Save as name", value=default_name, key="dc004_save_name")
         if st.button("💾 Save DC004", type="primary", key="dc004_btn_save", use_container_width=True):
+            # Build payload (Base + Inputs + Computed) only when actually saving
+            base_payload: Dict[str, Any] = {
+                "valve_design_id":   ss.get("active_design_id"),
+                "valve_design_name": ss.get("active_design_name"),
+                "nps_in":            ss.get("valve_nps"),
+                "asme_class":        ss.get("valve_asme_class"),
+                "bore_diameter_mm":  ss.get("bore_diameter_mm"),
+                "operating_pressure_mpa": ss.get("operating_pressure_mpa"),
+            }
+            inputs_payload: Dict[str, Any] = {
+                "SmF316_MPa": SmF316, "SaF316_MPa": SaF316,
+                "Di_mm": Di, "P_MPa": P, "PT_MPa": PT, "real_t_mm": real_t
+            }
+            computed_payload: Dict[str, Any] = {
+                "t_design_mm": t_design, "t_test_mm": t_test,
+                "required_t_mm": req_t, "verdict": verdict
+            }
+            payload: Dict[str, Any] = {"base": base_payload, "inputs": inputs_payload, "computed": computed_payload}
             try:
                 new_id = create_dc004_calc(user_id, save_name, payload)
+                _cached_dc004_list.clear()
                 st.success(f"Saved ✔ (ID: {new_id[:8]}…)")
             except Exception as e:
                 st.error(f"Save failed: {e}")
 
-    def _normalize_dc004_list(rows: List[Any]) -> List[Tuple[str, str, Any, Any]]:
-        out: List[Tuple[str, str, Any, Any]] = []
-        for r in rows or []:
-            rid, nm, ca, ua = None, "Untitled", None, None
-            if isinstance(r, (list, tuple)):
-                if len(r) >= 1: rid = r[0]
-                if len(r) >= 2 and r[1] not in (None, ""): nm = r[1]
-                if len(r) >= 3: ca = r[2]
-                if len(r) >= 4: ua = r[3]
-            elif isinstance(r, dict):
-                rid = r.get("id") or r.get("calc_id") or r.get("id_")
-                nm  = r.get("name") or nm
-                ca  = r.get("created_at")
-                ua  = r.get("updated_at")
-            elif isinstance(r, str):
-                rid = r
-            if rid:
-                out.append((str(rid), str(nm), ca, ua))
-        return out
-
     with colR:
-        items_raw = list_dc004_calcs(user_id)
-        items = _normalize_dc004_list(items_raw)
+        flash = ss.pop("_dc004_flash", None)
+        if flash:
+            getattr(st, flash[0])(flash[1])
+        items = _cached_dc004_list(user_id)
         if not items:
             st.info("No DC004 saves yet.")
         else:
+            # format each timestamp once; reused for labels and the picked-save caption
+            items_by_id = {_id: (nm, _fmt_dt(ca), _fmt_dt(ua)) for (_id, nm, ca, ua) in items}
             label_to_id = {
-                f"{nm} ({_id[:8]}…) • Created: {_fmt_dt(ca)} • Updated: {_fmt_dt(ua)}": _id
-                for (_id, nm, ca, ua) in items
+                f"{nm} ({_id[:8]}…) • Created: {ca} • Updated: {ua}": _id
+                for _id, (nm, ca, ua) in items_by_id.items()
             }
             picked = st.selectbox("My DC004 saves", ["-- none --", *label_to_id.keys()], key="dc004_pick")
             if picked != "-- none --":
                 sel_id = label_to_id[picked]
-                rec = get_dc004_calc(sel_id, user_id) or {}
+                rec = _cached_get_dc004(sel_id, user_id)
 
                 base_s  = rec.get("base") or {}
                 ins_s   = rec.get("inputs") or {}
                 comp_s  = rec.get("computed") or {}
 
-                created_at = next((ca for (_i, _n, ca, _u) in items if _i == sel_id), None)
-                updated_at = next((ua for (_i, _n, _c, ua) in items if _i == sel_id), None)
-                name_guess = next((nm for (_i, nm, _c, _u) in items if _i == sel_id), None)
+                name_guess, created_txt, updated_txt = items_by_id[sel_id]
 
                 st.caption(
                     f"Name: **{(name_guess or 'DC004')}** • "
-                    f"Created: **{_fmt_dt(created_at)}** • "
-                    f"Updated: **{_fmt_dt(updated_at)}**"
+                    f"Created: **{created_txt}** • "
+                    f"Updated: **{updated_txt}**"
                 )
 
                 st.markdown("#### Summary (Prettified)")
-                st.markdown("**Base (from Valve Data)**")
-                st.table(
-                    [
-                        ["Valve design name", base_s.get("valve_design_name")],
-                        ["Valve design ID",   base_s.get("valve_design_id")],
-                        ["NPS [in]",          base_s.get("nps_in")],
-                        ["ASME Class",        base_s.get("asme_class")],
-                        ["Bore (base) [mm]",  base_s.get("bore_diameter_mm")],
-                        ["Po (base) [MPa]",   base_s.get("operating_pressure_mpa")],
-                    ]
-                )
-
-                st.markdown("**Inputs**")
-                st.table(
-                    [
-                        ["SmF316 [MPa]", ins_s.get("SmF316_MPa")],
-                        ["SaF316 [MPa]", ins_s.get("SaF316_MPa")],
-                        ["Di [mm]",      ins_s.get("Di_mm")],
-                        ["P [MPa]",      ins_s.get("P_MPa")],
-                        ["PT [MPa]",     ins_s.get("PT_MPa")],
-                        ["Real t [mm]",  ins_s.get("real_t_mm")],
-                    ]
-                )
-
-                st.markdown("**Computed**")
-                st.table(
-                    [
-                        ["t_design [mm]", comp_s.get("t_design_mm")],
-                        ["t_test [mm]",   comp_s.get("t_test_mm")],
-                        ["Required t [mm]", comp_s.get("required_t_mm")],
-                        ["Check", comp_s.get("verdict")],
-                    ]
-                )
-
+                # Base / Inputs / Computed in ONE table (single frontend element)
+                st.table([
+                    ["Base",     "Valve design name", base_s.get("valve_design_name")],
+                    ["Base",     "Valve design ID",   base_s.get("valve_design_id")],
+                    ["Base",     "NPS [in]",          base_s.get("nps_in")],
+                    ["Base",     "ASME Class",        base_s.get("asme_class")],
+                    ["Base",     "Bore (base) [mm]",  base_s.get("bore_diameter_mm")],
+                    ["Base",     "Po (base) [MPa]",   base_s.get("operating_pressure_mpa")],
+                    ["Inputs",   "SmF316 [MPa]",      ins_s.get("SmF316_MPa")],
+                    ["Inputs",   "SaF316 [MPa]",      ins_s.get("SaF316_MPa")],
+                    ["Inputs",   "Di [mm]",           ins_s.get("Di_mm")],
+                    ["Inputs",   "P [MPa]",           ins_s.get("P_MPa")],
+                    ["Inputs",   "PT [MPa]",          ins_s.get("PT_MPa")],
+                    ["Inputs",   "Real t [mm]",       ins_s.get("real_t_mm")],
+                    ["Computed", "t_design [mm]",     comp_s.get("t_design_mm")],
+                    ["Computed", "t_test [mm]",       comp_s.get("t_test_mm")],
+                    ["Computed", "Required t [mm]",   comp_s.get("required_t_mm")],
+                    ["Computed", "Check",             comp_s.get("verdict")],
+                ])
+
+                # Actions run as on_click callbacks: they execute before the
+                # button's own rerun, so state (incl. widget keys) is updated in
+                # place and no extra st.rerun() is needed.
                 r1, r2, r3 = st.columns(3)
                 with r1:
-                    newname = st.text_input("Rename", value=(name_guess or "DC004"), key=f"dc004_rename_{sel_id}")
-                    if st.button("💾 Save name", key=f"dc004_btn_rename_{sel_id}", use_container_width=True):
-                        if update_dc004_calc(sel_id, user_id, name=newname):
-                            st.success("Renamed.")
-                            st.rerun()
-                        else:
-                            st.error("Rename failed.")
+                    st.text_input("Rename", value=(name_guess or "DC004"), key=f"dc004_rename_{sel_id}")
+                    st.button("💾 Save name", key=f"dc004_btn_rename_{sel_id}", use_container_width=True,
+                              on_click=_on_rename_dc004, args=(sel_id, user_id))
                 with r2:
-                    if st.button("🗑️ Delete", key=f"dc004_btn_delete_{sel_id}", use_container_width=True):
-                        if delete_dc004_calc(sel_id, user_id):
-                            st.success("Deleted.")
-                            st.rerun()
-                        else:
-                            st.error("Delete failed.")
+                    st.button("🗑️ Delete", key=f"dc004_btn_delete_{sel_id}", use_container_width=True,
+                              on_click=_on_delete_dc004, args=(sel_id, user_id))
                 with r3:
-                    if st.button("⬅ Load (fill session)", key=f"dc004_btn_load_{sel_id}", use_container_width=True):
-                        # restore inputs to session
-                        st.session_state["dc004_SmF316"] = ins_s.get("SmF316_MPa") or st.session_state.get("dc004_SmF316")
-                        st.session_state["dc004_SaF316"] = ins_s.get("SaF316_MPa") or st.session_state.get("dc004_SaF316")
-                        st.session_state["dc004_Di"] = ins_s.get("Di_mm") or st.session_state.get("dc004_Di")
-                        st.session_state["dc004_P"]  = ins_s.get("P_MPa") or st.session_state.get("dc004_P")
-                        st.session_state["dc004_PT"] = ins_s.get("PT_MPa") or st.session_state.get("dc004_PT")
-
-                        # also refresh base
-                        st.session_state["operating_pressure_mpa"] = base_s.get("operating_pressure_mpa") or st.session_state.get("operating_pressure_mpa")
-                        st.session_state["valve_nps"] = base_s.get("nps_in") or st.session_state.get("valve_nps")
-                        st.session_state["valve_asme_class"] = base_s.get("asme_class") or st.session_state.get("valve_asme_class")
-                        st.session_state["bore_diameter_mm"] = base_s.get("bore_diameter_mm") or st.session_state.get("bore_diameter_mm")
-
-                        st.success("Loaded into session.")
-                        st.rerun()
+                    st.button("⬅ Load (fill session)", key=f"dc004_btn_load_{sel_id}", use_container_width=True,
+                              on_click=_on_load_dc004, args=(ins_s, base_s))
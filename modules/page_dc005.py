@@ -1,10 +1,15 @@
 # page_dc005.py
 from __future__ import annotations
-import math, os
-from typing import List, Any, Tuple, Dict
-from PIL import Image
+import bisect, html, math, os
+from collections import namedtuple
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Any, Tuple, Dict, Optional, Sequence
+import pandas as pd
 import streamlit as st
 
+if TYPE_CHECKING:  # PIL is imported lazily, only when the sketch is drawn
+    from PIL import Image
+
 # ── auth + valve base (wizard)
 from auth import require_role, current_user
 from valve_repo import list_valve_designs, get_valve_design
@@ -12,7 +17,7 @@ from wizard_base import get_base, is_locked
 
 # ── DC005 repo (SQLite)
 from dc005_repo import (
-    create_dc005_calc, list_dc005_calcs, get_dc005_calc,
+    create_dc005_calc, list_dc005_calcs_with_payload,
     update_dc005_calc, delete_dc005_calc
 )
 
@@ -48,6 +53,27 @@ BOLT_TENSILE_AREAS_MM2 = {
     '3/4" UNC (3/4-10)': 0.3340 * 645.16,   # ≈215.5
 }
 
+# Selectbox options, frozen once (insertion order is the display order)
+_MATS: Tuple[str, ...] = tuple(BOLT_ALLOWABLES)
+_BOLT_OPTS: Tuple[str, ...] = tuple(BOLT_TENSILE_AREAS_MM2)
+
+# (size, area) sorted by area, plus the bare areas for bisect in the "closest bolt" pick
+_BOLT_AREAS_SORTED: Tuple[Tuple[str, float], ...] = tuple(
+    sorted(BOLT_TENSILE_AREAS_MM2.items(), key=lambda kv: kv[1])
+)
+_BOLT_AREAS_ONLY: Tuple[float, ...] = tuple(a for _, a in _BOLT_AREAS_SORTED)
+# selectbox index (insertion order) of each area-sorted entry
+_BOLT_OPT_IDX_BY_RANK: Tuple[int, ...] = tuple(
+    _BOLT_OPTS.index(k) for k, _ in _BOLT_AREAS_SORTED
+)
+
+@st.cache_data(show_spinner=False)
+def _bolt_allowables_df() -> pd.DataFrame:
+    # static reference data — build the expander table once, not on every rerun
+    df = pd.DataFrame.from_dict(BOLT_ALLOWABLES, orient="index")
+    df.index.name = "Material"
+    return df
+
 # ──────────────────────────────────────────────────────────────────────────────
 # CSS + layout helpers (labels left, fields right) — same pattern as dc003/dc004
 _ROW_CSS = """
@@ -61,6 +87,10 @@ _ROW_CSS = """
 .stTextInput > div > div > input,
 .stNumberInput > div > div > input{ height:40px !important; padding:0 .7rem !important; }
 .stSelectbox > div > div{ min-height:40px !important; }
+.row-value{
+  height:40px; display:flex; align-items:center; padding:0 .7rem; margin-bottom:1rem;
+  border-radius:.5rem; background:rgba(151,166,195,.15); color:rgba(49,51,63,.6);
+}
 .block-container .stMarkdown{ margin:0; }
 .badge{ padding:.35rem .8rem; border-radius:.5rem; color:#fff; font-weight:800; letter-spacing:.3px; display:inline-block; }
 .badge.ok{ background:#22c55e; }
@@ -71,41 +101,139 @@ _ROW_CSS = """
 def _css():
     st.markdown(_ROW_CSS, unsafe_allow_html=True)
 
+_ROW_TMPL = "<div class='row-label'>%s</div>"
+
+@lru_cache(maxsize=64)
+def _row_html(label: str) -> str:
+    # labels are a small fixed set: build each HTML snippet once per process
+    return _ROW_TMPL % label
+
 def _row(label: str):
     c1, c2 = st.columns([1.25, 2.25])
     with c1:
-        st.markdown(f"<div class='row-label'>{label}</div>", unsafe_allow_html=True)
+        st.markdown(_row_html(label), unsafe_allow_html=True)
     return c2
 
+_BADGE_OK  = "<span class='badge ok'>VERIFIED</span>"
+_BADGE_BAD = "<span class='badge bad'>NOT VERIFIED</span>"
+
+@lru_cache(maxsize=1024, typed=True)   # typed: 1 and 1.0 format differently under "{}"
+def _fmt_cached(fmt: str, value) -> str:
+    return html.escape(fmt.format(value))
+
 def _out_calc(key: str, value, fmt: str = "{}"):
     """
-    Disabled text field that always shows the latest computed value.
+    Read-only value box styled like a disabled input — a single markdown element,
+    so computed outputs don't allocate a widget / session_state slot per rerun.
     """
-    s = fmt.format(value) if value is not None else ""
-    st.session_state[key] = s  # keep widget in sync with current value
-    st.text_input("", key=key, disabled=True, label_visibility="collapsed")
+    if value is None:
+        s = ""
+    else:
+        try:
+            s = _fmt_cached(fmt, value)   # unchanged numbers skip format + escape
+        except TypeError:                 # unhashable header value
+            s = html.escape(fmt.format(value))
+    st.markdown(f"<div class='row-value' id='{key}'>{s}</div>", unsafe_allow_html=True)
 
-def _selectbox_with_state(key: str, options: List[str], default_index: int = 0):
+def _selectbox_with_state(key: str, options: Sequence[str], default_index: int = 0):
     if key in st.session_state:
         return st.selectbox("", options, key=key, label_visibility="collapsed")
     return st.selectbox("", options, index=default_index, key=key, label_visibility="collapsed")
 
+@st.cache_resource(show_spinner=False)
+def _load_dc005_image(path: str, size_px: int) -> Image.Image:
+    # decode + Lanczos resample once per process instead of on every rerun
+    from PIL import Image
+    img = Image.open(path)
+    if img.mode != "RGBA":
+        img = img.convert("RGBA")
+    if img.size != (size_px, size_px):   # skip the Lanczos pass for pre-sized assets
+        img = img.resize((size_px, size_px), Image.LANCZOS)
+    return img
+
+# Resolved once at import; the gland sketch is a static bundled asset
+_DC005_IMG_PATH = next(
+    (p for p in ("dc005_gland.png", "assets/dc005_gland.png", "static/dc005_gland.png") if os.path.exists(p)),
+    None,
+)
+
 def _show_dc005_image(container, size_px: int = 300):
-    for p in ["dc005_gland.png", "assets/dc005_gland.png", "static/dc005_gland.png"]:
-        if os.path.exists(p):
-            try:
-                img = Image.open(p).convert("RGBA").resize((size_px, size_px), Image.LANCZOS)
-                with container:
-                    st.image(img, caption="Body/Gland plate flange – bolting", use_column_width=False)
-            except Exception as e:
-                with container:
-                    st.warning(f"Could not load DC005 image ({e}).")
-            return
-    with container:
-        st.info("Add **dc005_gland.png** (or put it in ./assets/ or ./static/) to show the drawing.")
+    p = _DC005_IMG_PATH
+    if p is None:
+        with container:
+            st.info("Add **dc005_gland.png** (or put it in ./assets/ or ./static/) to show the drawing.")
+        return
+    try:
+        img = _load_dc005_image(p, size_px)
+        with container:
+            st.image(img, caption="Body/Gland plate flange – bolting", use_column_width=False)
+    except Exception as e:
+        with container:
+            st.warning(f"Could not load DC005 image ({e}).")
+
+# ── Pure DC005 numerics (floats only → hashable, so reruns with unchanged inputs are a cache hit)
+_Load = namedtuple("_Load", "ring_area H Wm1 Am")
+_Stress = namedtuple("_Stress", "Ab Sa_eff")
+
+@lru_cache(maxsize=128)
+def _dc005_load(G: float, Gstem: float, Pa: float, S: float) -> _Load:
+    ring_area = (math.pi / 4.0) * max(G**2 - Gstem**2, 0.0)   # mm²
+    H = ring_area * Pa                                       # N  (since MPa = N/mm²)
+    Wm1 = H
+    Am = Wm1 / max(S, 1e-9)                                  # mm²
+    return _Load(ring_area, H, Wm1, Am)
+
+@lru_cache(maxsize=128)
+def _dc005_stress(Wm1: float, a: float, n: int) -> _Stress:
+    Ab = a * n
+    return _Stress(Ab, Wm1 / max(Ab, 1e-9))
+
+# ── Cached list reads (user-scoped; cleared on save/rename/delete)
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_list_dc005(uid: str):
+    # rows carry their saved data too, so picking a save needs no second query
+    return list_dc005_calcs_with_payload(uid)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_list_valve_designs(uid: str, limit: int = 1):
+    return list_valve_designs(uid, limit=limit)
+
+@st.cache_data(ttl=120, show_spinner=False)
+def _cached_get_valve_design(vid: str, uid: str) -> Dict[str, Any]:
+    return get_valve_design(vid, uid) or {}
+
+# ── Save list rows: one NamedTuple per save (data included), looked up by id
+_SaveRow = namedtuple("_SaveRow", "id name created_at updated_at data")
+
+def _save_row(r: Any) -> Optional[_SaveRow]:
+    rid, nm, ca, ua, data = None, "Untitled", None, None, None
+    if isinstance(r, (list, tuple)):
+        if len(r) >= 1: rid = r[0]
+        if len(r) >= 2 and r[1] not in (None, ""): nm = r[1]
+        if len(r) >= 3: ca = r[2]
+        if len(r) >= 4: ua = r[3]
+        if len(r) >= 5: data = r[4]
+    elif isinstance(r, dict):
+        rid = r.get("id")
+        nm  = r.get("name") or nm
+        ca  = r.get("created_at")
+        ua  = r.get("updated_at")
+        data = r.get("data")
+    elif isinstance(r, str):
+        rid = r
+    if not rid:
+        return None
+    return _SaveRow(str(rid), str(nm), ca, ua, data if isinstance(data, dict) else {})
+
+def _normalize_dc005_list(rows: List[Any]) -> List[_SaveRow]:
+    return [row for row in map(_save_row, rows or []) if row is not None]
 
 # ── Wizard/base seeding (same style as your other pages; no layout changes)
 def _seed_base_from_valve(user_id: str | None):
+    # Run once per session; the Load handler drops the flag to re-hydrate
+    if st.session_state.get("_dc005_seeded"):
+        return
+
     # 1) Wizard lock hydration
     if is_locked():
         wb = get_base() or {}
@@ -122,13 +250,14 @@ def _seed_base_from_valve(user_id: str | None):
 
     # already seeded enough?
     if all(st.session_state.get(k) not in (None, "", 0) for k in ("valve_nps", "valve_asme_class")):
+        st.session_state["_dc005_seeded"] = True
         return
 
     # 2) fallback to latest valve design
     if not user_id:
         return
     try:
-        rows = list_valve_designs(user_id, limit=1)
+        rows = _cached_list_valve_designs(user_id, limit=1)
         if not rows:
             return
         # normalize first row
@@ -147,7 +276,7 @@ def _seed_base_from_valve(user_id: str | None):
         if not vid:
             return
 
-        vdata = get_valve_design(vid, user_id) or {}
+        vdata = _cached_get_valve_design(vid, user_id)
         vcalc = vdata.get("calculated") or {}
 
         st.session_state.setdefault("valve_nps", vdata.get("nps_in"))
@@ -159,6 +288,7 @@ def _seed_base_from_valve(user_id: str | None):
         )
         st.session_state.setdefault("active_design_id", vid)
         st.session_state.setdefault("active_design_name", vname)
+        st.session_state["_dc005_seeded"] = True
     except Exception:
         pass
 
@@ -201,44 +331,57 @@ def render_dc005():
     Pa_default = float(st.session_state.get("operating_pressure_mpa", 10.21))
 
     # Inputs (labels left, inputs right) — layout & math unchanged
-    i = _row("Gasket tight diameter  G  [mm] =")
-    with i:
-        G = st.number_input("", value=64.5, step=0.05, format="%.2f",
-                            key="dc005_G", label_visibility="collapsed")
-
-    i = _row("Stem seal tight diameter  Gstem  [mm] =")
-    with i:
-        Gstem = st.number_input("", value=27.85, step=0.05, format="%.2f",
-                                key="dc005_Gstem", label_visibility="collapsed")
-
-    i = _row("Design pressure  Pa  [MPa] =")
-    with i:
-        Pa = st.number_input("", value=Pa_default, step=0.01, format="%.2f",
-                             key="dc005_Pa", label_visibility="collapsed")
-
-    i = _row("Pressure rating – Class designation  Pe  [MPa] =")
-    with i:
-        Pe = st.number_input("", value=0.0, step=0.01, format="%.2f",
-                             key="dc005_Pe", label_visibility="collapsed")
-
-    # Material select + S (allowable).
-    mats = list(BOLT_ALLOWABLES.keys())
-    i = _row("Bolt material =")
-    with i:
-        mat = _selectbox_with_state("dc005_mat", mats, default_index=1)  # default B7M
-
-    i = _row("Allowable bolt stress, ASME VIII Div.1 App-2 (S) [MPa] =")
-    with i:
-        default_S = float(BOLT_ALLOWABLES[mat]["Sa"])
-        S = st.number_input(
-            "",
-            value=default_S, step=1.0, format="%.0f",
-            key=f"dc005_S_for_{mat}", label_visibility="collapsed"
-        )
+    # One form for the input block: edits are applied together on "Recalculate"
+    # instead of rerunning the whole page on every keystroke.
+    with st.form("dc005_inputs", clear_on_submit=False, border=False):
+        i = _row("Gasket tight diameter  G  [mm] =")
+        with i:
+            G = st.number_input("", value=64.5, step=0.05, format="%.2f",
+                                key="dc005_G", label_visibility="collapsed")
+
+        i = _row("Stem seal tight diameter  Gstem  [mm] =")
+        with i:
+            Gstem = st.number_input("", value=27.85, step=0.05, format="%.2f",
+                                    key="dc005_Gstem", label_visibility="collapsed")
+
+        i = _row("Design pressure  Pa  [MPa] =")
+        with i:
+            Pa = st.number_input("", value=Pa_default, step=0.01, format="%.2f",
+                                 key="dc005_Pa", label_visibility="collapsed")
+
+        i = _row("Pressure rating – Class designation  Pe  [MPa] =")
+        with i:
+            Pe = st.number_input("", value=0.0, step=0.01, format="%.2f",
+                                 key="dc005_Pe", label_visibility="collapsed")
+
+        # Material select + S (allowable).
+        i = _row("Bolt material =")
+        with i:
+            mat = _selectbox_with_state("dc005_mat", _MATS, default_index=1)  # default B7M
+
+        i = _row("Allowable bolt stress, ASME VIII Div.1 App-2 (S) [MPa] =")
+        with i:
+            default_S = float(BOLT_ALLOWABLES[mat]["Sa"])
+            # One stable key (the material and S arrive in the same form submit).
+            # Re-seed only when the material moves the default AND S still holds the
+            # previous default, so an S typed alongside a material change is kept.
+            prev_default = st.session_state.get("_dc005_S_default")
+            if prev_default != default_S:
+                if st.session_state.get("dc005_S") in (None, prev_default):
+                    st.session_state["dc005_S"] = default_S
+                st.session_state["_dc005_S_default"] = default_S
+            S = st.number_input(
+                "",
+                step=1.0, format="%.0f",
+                key="dc005_S", label_visibility="collapsed"
+            )
+        i = _row("")
+        with i:
+            st.form_submit_button("Recalculate")
 
     # Optional materials table (kept out of main layout)
     with st.expander("Allowable bolt stress table (ASME II Part D – Table 3)"):
-        st.write({k: v for k, v in BOLT_ALLOWABLES.items()})
+        st.dataframe(_bolt_allowables_df(), use_container_width=True)
 
     # Picture (aligned to layout)
     i = _row("Sketch")
@@ -247,10 +390,8 @@ def render_dc005():
     st.markdown("---")
     st.markdown("### DESIGN LOAD")
 
-    # DESIGN LOAD (unchanged)
-    ring_area = (math.pi / 4.0) * max(G**2 - Gstem**2, 0.0)   # mm²
-    H = ring_area * Pa                                       # N  (since MPa = N/mm²)
-    Wm1 = H
+    # DESIGN LOAD — split in two because the bolt size (a) is picked only after H/Am are shown
+    ring_area, H, Wm1, Am = _dc005_load(float(G), float(Gstem), float(Pa), float(S))
 
     i = _row("Total hydrostatic end force  H [N] = π/4 × (G² − Gstem²) × Pa =")
     with i:
@@ -263,7 +404,6 @@ def render_dc005():
     st.markdown("---")
     st.markdown("### BOLTS SECTION CALCULATION")
 
-    Am = Wm1 / max(S, 1e-9)  # mm²
     i = _row("Limit Stress used for bolts :  S = Sa for ASME VIII Div.1")
     with i:
         _out_calc("dc005_out_S_repeat", S, "{:.0f}")
@@ -285,16 +425,14 @@ def render_dc005():
         _out_calc("dc005_out_a_req", a_req, "{:,.3f}")
 
     # Choose bolt (closest ≥ a')
-    bolt_opts = list(BOLT_TENSILE_AREAS_MM2.keys())
     default_idx = 0
-    for i_opt, k in enumerate(bolt_opts):
-        if BOLT_TENSILE_AREAS_MM2[k] >= a_req:
-            default_idx = i_opt
-            break
+    j = bisect.bisect_left(_BOLT_AREAS_ONLY, a_req)
+    if j < len(_BOLT_OPT_IDX_BY_RANK):
+        default_idx = _BOLT_OPT_IDX_BY_RANK[j]
 
     i = _row("We take the closest bolts having a > a'")
     with i:
-        bolt_size = _selectbox_with_state("dc005_bolt_sel", bolt_opts, default_index=default_idx)
+        bolt_size = _selectbox_with_state("dc005_bolt_sel", _BOLT_OPTS, default_index=default_idx)
 
     a = float(BOLT_TENSILE_AREAS_MM2[bolt_size])
     i = _row("Bolt dimension — Actual tensile stress area  a [mm²] =")
@@ -304,8 +442,7 @@ def render_dc005():
     st.markdown("---")
     st.markdown("### ACTUAL TENSILE STRESS CALCULATION")
 
-    Ab = a * n
-    Sa_eff = Wm1 / max(Ab, 1e-9)
+    Ab, Sa_eff = _dc005_stress(Wm1, a, int(n))
 
     i = _row("Total bolt tensile stress area  Ab [mm²] = a × n =")
     with i:
@@ -319,20 +456,10 @@ def render_dc005():
     i = _row("Check  (Sa_eff ≤ S)")
     with i:
         st.markdown(
-            f"<span class='badge {'ok' if verdict=='VERIFIED' else 'bad'}'>{verdict}</span>",
+            _BADGE_OK if verdict == "VERIFIED" else _BADGE_BAD,
             unsafe_allow_html=True
         )
 
-    # Save to state (unchanged)
-    st.session_state["dc005"] = {
-        "G_mm": G, "Gstem_mm": Gstem, "Pa_MPa": Pa, "Pe_MPa": Pe,
-        "material": mat, "S_MPa": S,
-        "ring_area_mm2": ring_area, "H_N": H, "Wm1_N": Wm1,
-        "Am_mm2": Am, "n": n, "a_req_each_mm2": a_req,
-        "bolt_size": bolt_size, "a_mm2": a, "Ab_mm2": Ab,
-        "Sa_eff_MPa": Sa_eff, "verdict": verdict
-    }
-
     # ───────────────── Save / Load (backend) ─────────────────
     st.markdown("---")
     st.markdown("### Save / Load DC005")
@@ -341,34 +468,34 @@ def render_dc005():
         st.info("Log in to save your DC005 calculations.")
         return
 
-    # Build payload (Base + Inputs + Computed)
-    base_payload: Dict[str, Any] = {
-        "valve_design_id":   st.session_state.get("active_design_id"),
-        "valve_design_name": st.session_state.get("active_design_name"),
-        "nps_in":            st.session_state.get("valve_nps"),
-        "asme_class":        st.session_state.get("valve_asme_class"),
-        "bore_diameter_mm":  st.session_state.get("bore_diameter_mm"),
-        "operating_pressure_mpa": st.session_state.get("operating_pressure_mpa"),
-    }
-    inputs_payload: Dict[str, Any] = {
-        "G_mm": G, "Gstem_mm": Gstem, "Pa_MPa": Pa, "Pe_MPa": Pe,
-        "material": mat, "S_MPa": S, "n": n, "bolt_size": bolt_size
-    }
-    computed_payload: Dict[str, Any] = {
-        "ring_area_mm2": ring_area, "H_N": H, "Wm1_N": Wm1,
-        "Am_mm2": Am, "a_req_each_mm2": a_req, "a_mm2": a, "Ab_mm2": Ab,
-        "Sa_eff_MPa": Sa_eff, "verdict": verdict
-    }
-    payload: Dict[str, Any] = {"base": base_payload, "inputs": inputs_payload, "computed": computed_payload}
-
     colL, colR = st.columns([1.2, 1.8])
 
     with colL:
         default_name = f"DC005_{st.session_state.get('active_design_name') or 'calc'}"
         save_name = st.text_input("Save as name", value=default_name, key="dc005_save_name")
         if st.button("💾 Save DC005", type="primary", key="dc005_btn_save", use_container_width=True):
+            # Build payload (Base + Inputs + Computed) only when actually saving
+            base_payload: Dict[str, Any] = {
+                "valve_design_id":   st.session_state.get("active_design_id"),
+                "valve_design_name": st.session_state.get("active_design_name"),
+                "nps_in":            st.session_state.get("valve_nps"),
+                "asme_class":        st.session_state.get("valve_asme_class"),
+                "bore_diameter_mm":  st.session_state.get("bore_diameter_mm"),
+                "operating_pressure_mpa": st.session_state.get("operating_pressure_mpa"),
+            }
+            inputs_payload: Dict[str, Any] = {
+                "G_mm": G, "Gstem_mm": Gstem, "Pa_MPa": Pa, "Pe_MPa": Pe,
+                "material": mat, "S_MPa": S, "n": n, "bolt_size": bolt_size
+            }
+            computed_payload: Dict[str, Any] = {
+                "ring_area_mm2": ring_area, "H_N": H, "Wm1_N": Wm1,
+                "Am_mm2": Am, "a_req_each_mm2": a_req, "a_mm2": a, "Ab_mm2": Ab,
+                "Sa_eff_MPa": Sa_eff, "verdict": verdict
+            }
+            payload: Dict[str, Any] = {"base": base_payload, "inputs": inputs_payload, "computed": computed_payload}
             try:
                 new_id = create_dc005_calc(user_id, save_name, payload)
+                _cached_list_dc005.clear()
                 st.success(f"Saved ✔ (ID: {new_id[:8]}…)")
             except Exception as e:
                 st.error(f"Save failed: {e}")
@@ -379,47 +506,27 @@ def render_dc005():
         except Exception:
             return str(x)
 
-    def _normalize_dc005_list(rows: List[Any]) -> List[Tuple[str, str, Any, Any]]:
-        out = []
-        for r in rows or []:
-            rid, nm, ca, ua = None, "Untitled", None, None
-            if isinstance(r, (list, tuple)):
-                if len(r) >= 1: rid = r[0]
-                if len(r) >= 2 and r[1] not in (None, ""): nm = r[1]
-                if len(r) >= 3: ca = r[2]
-                if len(r) >= 4: ua = r[3]
-            elif isinstance(r, dict):
-                rid = r.get("id")
-                nm  = r.get("name") or nm
-                ca  = r.get("created_at")
-                ua  = r.get("updated_at")
-            elif isinstance(r, str):
-                rid = r
-            if rid:
-                out.append((str(rid), str(nm), ca, ua))
-        return out
-
     with colR:
-        items_raw = list_dc005_calcs(user_id)
+        items_raw = _cached_list_dc005(user_id)
         items = _normalize_dc005_list(items_raw)
         if not items:
             st.info("No DC005 saves yet.")
         else:
+            rows_by_id = {row.id: row for row in items}
             label_to_id = {
-                f"{nm} ({_id[:8]}…) • Created: {_fmt_dt(ca)} • Updated: {_fmt_dt(ua)}": _id
-                for (_id, nm, ca, ua) in items
+                f"{row.name} ({row.id[:8]}…) • Created: {_fmt_dt(row.created_at)} • Updated: {_fmt_dt(row.updated_at)}": row.id
+                for row in items
             }
             picked = st.selectbox("My DC005 saves", ["-- none --", *label_to_id.keys()], key="dc005_pick")
             if picked != "-- none --":
                 sel_id = label_to_id[picked]
-                rec = get_dc005_calc(sel_id, user_id) or {}
+                sel = rows_by_id[sel_id]
+                rec = sel.data
                 base_s  = rec.get("base") or {}
                 ins_s   = rec.get("inputs") or {}
                 comp_s  = rec.get("computed") or {}
 
-                created_at = next((ca for (_i, _n, ca, _u) in items if _i == sel_id), None)
-                updated_at = next((ua for (_i, _n, _c, ua) in items if _i == sel_id), None)
-                name_guess = next((nm for (_i, nm, _c, _u) in items if _i == sel_id), None)
+                created_at, updated_at, name_guess = sel.created_at, sel.updated_at, sel.name
 
                 st.caption(
                     f"Name: **{(name_guess or 'DC005')}** • "
@@ -441,6 +548,7 @@ def render_dc005():
                     newname = st.text_input("Rename", value=(name_guess or "DC005"), key=f"dc005_rename_{sel_id}")
                     if st.button("💾 Save name", key=f"dc005_btn_rename_{sel_id}", use_container_width=True):
                         if update_dc005_calc(sel_id, user_id, name=newname):
+                            _cached_list_dc005.clear()
                             st.success("Renamed.")
                             st.rerun()
                         else:
@@ -448,6 +556,7 @@ def render_dc005():
                 with r2:
                     if st.button("🗑️ Delete", key=f"dc005_btn_delete_{sel_id}", use_container_width=True):
                         if delete_dc005_calc(sel_id, user_id):
+                            _cached_list_dc005.clear()
                             st.success("Deleted.")
                             st.rerun()
                         else:
@@ -459,10 +568,14 @@ def render_dc005():
                         st.session_state["dc005_Gstem"] = ins_s.get("Gstem_mm") or st.session_state.get("dc005_Gstem")
                         st.session_state["dc005_Pa"] = ins_s.get("Pa_MPa") or st.session_state.get("dc005_Pa")
                         st.session_state["dc005_Pe"] = ins_s.get("Pe_MPa") or st.session_state.get("dc005_Pe")
-                        st.session_state["dc005_mat"] = ins_s.get("material") or st.session_state.get("dc005_mat")
-                        st.session_state[f"dc005_S_for_{ins_s.get('material','A193 B7M')}"] = (
-                            ins_s.get("S_MPa") or st.session_state.get(f"dc005_S_for_{ins_s.get('material','A193 B7M')}")
-                        )
+                        mat_val = ins_s.get("material")
+                        if isinstance(mat_val, str) and mat_val in BOLT_ALLOWABLES:
+                            st.session_state["dc005_mat"] = mat_val
+                        st.session_state["dc005_S"] = ins_s.get("S_MPa") or st.session_state.get("dc005_S")
+                        mat_now = st.session_state.get("dc005_mat")
+                        if mat_now in BOLT_ALLOWABLES:
+                            # keep the loaded S from being re-seeded off the loaded material
+                            st.session_state["_dc005_S_default"] = float(BOLT_ALLOWABLES[mat_now]["Sa"])
                         st.session_state["dc005_n"] = ins_s.get("n") or st.session_state.get("dc005_n")
 
                         # base
@@ -470,6 +583,7 @@ def render_dc005():
                         st.session_state["valve_nps"] = base_s.get("nps_in") or st.session_state.get("valve_nps")
                         st.session_state["valve_asme_class"] = base_s.get("asme_class") or st.session_state.get("valve_asme_class")
                         st.session_state["bore_diameter_mm"] = base_s.get("bore_diameter_mm") or st.session_state.get("bore_diameter_mm")
+                        st.session_state.pop("_dc005_seeded", None)
 
                         st.success("Loaded into session.")
                         st.rerun()
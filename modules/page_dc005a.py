@@ -1,12 +1,15 @@
 # page_dc005a.py
 from __future__ import annotations
-import math, os
-from typing import List, Any, Dict, Optional, Tuple
-from PIL import Image
+import bisect, html, math, os
+from contextlib import suppress
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Any, Dict, Optional, Tuple
 import streamlit as st
-import pandas as pd
 from datetime import datetime
 
+if TYPE_CHECKING:  # PIL is imported lazily, only when the sketch is decoded
+    from PIL import Image
+
 # ── Auth + wizard base (same pattern as other pages)
 from auth import require_role, current_user
 from valve_repo import list_valve_designs, get_valve_design
@@ -30,6 +33,19 @@ BOLT_TENSILE_AREAS_MM2 = {
     '3/4" UNC (3/4-10)': 0.3340 * 645.16,   # ≈215.5
 }
 
+# Bolt-size options in table order (insertion order is the display order)
+_BOLT_NAMES: Tuple[str, ...] = tuple(BOLT_TENSILE_AREAS_MM2)
+
+# (size, area) sorted by area, plus the bare areas for bisect in the "closest bolt" pick
+_BOLT_AREAS_SORTED: Tuple[Tuple[str, float], ...] = tuple(
+    sorted(BOLT_TENSILE_AREAS_MM2.items(), key=lambda kv: kv[1])
+)
+_BOLT_AREAS_ONLY: Tuple[float, ...] = tuple(a for _, a in _BOLT_AREAS_SORTED)
+# selectbox index (table order) of each area-sorted entry
+_BOLT_OPT_IDX_BY_RANK: Tuple[int, ...] = tuple(
+    _BOLT_NAMES.index(k) for k, _ in _BOLT_AREAS_SORTED
+)
+
 # ---- Bolt yield strengths Syb [MPa] for test condition (you can extend this)
 BOLT_YIELD_MPA = {
     "A193 B7M": 550.0,    # your note on the sheet
@@ -55,10 +71,16 @@ _ROW_CSS = """
 .badge{ padding:.35rem .8rem; border-radius:.5rem; color:#fff; font-weight:800; letter-spacing:.3px; display:inline-block; }
 .badge.ok{ background:#22c55e; }
 .badge.bad{ background:#ef4444; }
+.kv{ width:100%; border-collapse:collapse; margin-bottom:1rem; }
+.kv td, .kv th{ padding:.35rem .6rem; border-bottom:1px solid rgba(49,51,63,.1); text-align:left; }
+.kv td:first-child{ font-weight:600; color:#0f172a; width:45%; }
+.kv tr.kv-sec th{ padding-top:.8rem; font-weight:800; border-bottom:2px solid rgba(49,51,63,.2); }
 </style>
 """
 
 def _css():
+    # Not guarded by a session flag: styles only persist while each run re-emits them
+    # (same reasoning as page_dc003._css).
     st.markdown(_ROW_CSS, unsafe_allow_html=True)
 
 def _row(label: str):
@@ -77,19 +99,33 @@ def _selectbox_with_state(key: str, options: List[str], default_index: int = 0):
         return st.selectbox("", options, key=key, label_visibility="collapsed")
     return st.selectbox("", options, index=default_index, key=key, label_visibility="collapsed")
 
+# Resolved once at import: missing assets aren't re-stat'd on every rerun
+_DC005A_IMG_PATH = next(
+    (p for p in ("dc005_gland.png", "assets/dc005_gland.png", "static/dc005_gland.png") if os.path.exists(p)),
+    None,
+)
+
+@st.cache_resource(show_spinner=False)
+def _load_dc005a_image(path: str, size_px: int) -> Image.Image:
+    # Static asset: decode + resample once per process, share across reruns
+    from PIL import Image
+    img = Image.open(path)
+    img.load()
+    return img.convert("RGBA").resize((size_px, size_px), Image.LANCZOS)
+
 def _show_dc005a_image(container, size_px: int = 300):
-    for p in ["dc005_gland.png", "assets/dc005_gland.png", "static/dc005_gland.png"]:
-        if os.path.exists(p):
-            try:
-                img = Image.open(p).convert("RGBA").resize((size_px, size_px), Image.LANCZOS)
-                with container:
-                    st.image(img, caption="Body/Gland plate flange – bolting", use_column_width=False)
-            except Exception as e:
-                with container:
-                    st.warning(f"Could not load DC005 image ({e}).")
-            return
-    with container:
-        st.info("Add **dc005_gland.png** (or put it in ./assets/ or ./static/) to show the drawing.")
+    p = _DC005A_IMG_PATH
+    if p is None:
+        with container:
+            st.info("Add **dc005_gland.png** (or put it in ./assets/ or ./static/) to show the drawing.")
+        return
+    try:
+        img = _load_dc005a_image(p, size_px)
+        with container:
+            st.image(img, caption="Body/Gland plate flange – bolting", use_column_width=False)
+    except Exception as e:
+        with container:
+            st.warning(f"Could not load DC005 image ({e}).")
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Wizard hydration helpers (same idea as DC003)
@@ -108,6 +144,10 @@ def _normalize_first_pair(rows: List[Any]) -> Tuple[Optional[str], Optional[str]
     return (str(rid) if rid else None, str(nm) if nm else None)
 
 def _seed_base_from_valve(user_id: Optional[str]):
+    # Run once per session; the Load handler drops the flag to re-hydrate
+    if st.session_state.get("_dc005a_seeded"):
+        return
+
     # 1) If the wizard is locked, hydrate from it
     if is_locked():
         wb = get_base() or {}
@@ -124,6 +164,7 @@ def _seed_base_from_valve(user_id: Optional[str]):
 
     # enough?
     if all(st.session_state.get(k) not in (None, "", 0) for k in ("valve_nps", "valve_asme_class")):
+        st.session_state["_dc005a_seeded"] = True
         return
 
     # 2) Fallback to latest valve design for this user
@@ -145,21 +186,57 @@ def _seed_base_from_valve(user_id: Optional[str]):
         )
         st.session_state.setdefault("active_design_id", vid)
         st.session_state.setdefault("active_design_name", vname)
+        st.session_state["_dc005a_seeded"] = True
     except Exception:
         pass
 
-def _fmt_dt(x: Any) -> str:
-    if not x: return "—"
+# Most common first: PostgREST returns ISO 'T' timestamps with microseconds
+_DT_FORMATS = ("%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%d %H:%M:%S.%f", "%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S")
+
+@lru_cache(maxsize=2048)
+def _fmt_dt_str(s: str) -> str:
+    base = s[:26]
+    # Fast path: C-level ISO parser; strptime loop only for odd shapes
     try:
-        base = str(x)[:26]
-        for fmt in ("%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%d %H:%M:%S.%f", "%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S"):
-            try:
-                return datetime.strptime(base, fmt).strftime("%Y-%m-%d %H:%M")
-            except Exception:
-                pass
-    except Exception:
+        return datetime.fromisoformat(base).strftime("%Y-%m-%d %H:%M")
+    except ValueError:
         pass
-    return str(x)[:16]
+    for fmt in _DT_FORMATS:
+        with suppress(ValueError):
+            return datetime.strptime(base, fmt).strftime("%Y-%m-%d %H:%M")
+    return s[:16]
+
+def _fmt_dt(x: Any) -> str:
+    if not x: return "—"
+    if isinstance(x, datetime):
+        return x.strftime("%Y-%m-%d %H:%M")
+    return _fmt_dt_str(str(x))
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_list_dc005a(uid: str):
+    return list_dc005a_calcs(uid)
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _build_label_map(items: Tuple[Tuple[str, str, Any, Any], ...]) -> Dict[str, str]:
+    # label -> id for the saves selectbox; rebuilt only when the list itself changes
+    return {
+        f"{nm} ({_id[:8]}…) • Created: {_fmt_dt(ca)} • Updated: {_fmt_dt(ua)}": _id
+        for (_id, nm, ca, ua) in items
+    }
+
+def _kv_html(sections: Tuple[Tuple[str, Tuple[Tuple[str, Any], ...]], ...]) -> str:
+    """
+    One plain HTML Field/Value table for the saved-record summary (a header row per
+    section) — a single markdown element instead of pandas → Arrow → table component.
+    """
+    parts: List[str] = []
+    for title, pairs in sections:
+        parts.append(f"<tr class='kv-sec'><th colspan='2'>{html.escape(title)}</th></tr>")
+        parts.extend(
+            f"<tr><td>{html.escape(k)}</td><td>{'' if v is None else html.escape(str(v))}</td></tr>"
+            for k, v in pairs
+        )
+    return "<table class='kv'>" + "".join(parts) + "</table>"
 
 # ──────────────────────────────────────────────────────────────────────────────
 def render_dc005a():
@@ -247,8 +324,12 @@ def render_dc005a():
     i = _row("Allowable bolt stress (hydrostatic test)  S = 0.83 × Syb  [MPa]")
     with i:
         default_S = round(0.83 * float(Syb), 1)
-        S = st.number_input("", value=default_S, step=0.1, format="%.1f",
-                            key=f"dc005a_S_for_{default_S:.1f}", label_visibility="collapsed")
+        # One stable key; re-seed it only when Syb moves the default (S still follows Syb)
+        if st.session_state.get("_dc005a_S_default") != default_S:
+            st.session_state["dc005a_S"] = default_S
+            st.session_state["_dc005a_S_default"] = default_S
+        S = st.number_input("", step=0.1, format="%.1f",
+                            key="dc005a_S", label_visibility="collapsed")
 
     st.caption("API 6D 25th (Test condition), ASME II Part D (Tab.3)")
 
@@ -259,9 +340,18 @@ def render_dc005a():
     st.markdown("---")
     st.markdown("### DESIGN LOAD")
 
-    ring_area = (math.pi / 4.0) * max(G**2 - Gstem**2, 0.0)    # mm²
-    H = ring_area * Pa_test                                    # N (MPa × mm² = N)
-    Wm1 = H
+    # Reuse the load chain from the previous run when G/Gstem/Pa_test/S are unchanged
+    # (e.g. reruns triggered by the save-name field or the bolt selectors)
+    load_key = (G, Gstem, Pa_test, S)
+    memo = st.session_state.get("_dc005a_load")
+    if memo and memo[0] == load_key:
+        ring_area, H, Wm1, Am = memo[1]
+    else:
+        ring_area = (math.pi / 4.0) * max(G**2 - Gstem**2, 0.0)    # mm²
+        H = ring_area * Pa_test                                    # N (MPa × mm² = N)
+        Wm1 = H
+        Am = Wm1 / max(S, 1e-9)                                    # mm²
+        st.session_state["_dc005a_load"] = (load_key, (ring_area, H, Wm1, Am))
 
     i = _row("Total hydrostatic end force  H [N] = π/4 × (G² − Gstem²) × Pa_test =")
     with i:
@@ -274,7 +364,6 @@ def render_dc005a():
     st.markdown("---")
     st.markdown("### BOLTS SECTION CALCULATION")
 
-    Am = Wm1 / max(S, 1e-9)  # mm²
     i = _row("Limit Stress used for bolts :  Sm for ASME VIII Div.2 (test)")
     with i:
         _out_calc("dc005a_out_S_repeat", S, "{:.1f}")
@@ -296,13 +385,12 @@ def render_dc005a():
     with i:
         _out_calc("dc005a_out_a_req", a_req, "{:,.4f}")
 
-    # Select bolt size (closest ≥ a')
-    bolt_opts = list(BOLT_TENSILE_AREAS_MM2.keys())
+    # Select bolt size (closest ≥ a'); bisect on the area-sorted index, map back to table order
+    bolt_opts = _BOLT_NAMES
     default_idx = 0
-    for i_opt, k in enumerate(bolt_opts):
-        if BOLT_TENSILE_AREAS_MM2[k] >= a_req:
-            default_idx = i_opt
-            break
+    j = bisect.bisect_left(_BOLT_AREAS_ONLY, a_req)
+    if j < len(_BOLT_OPT_IDX_BY_RANK):
+        default_idx = _BOLT_OPT_IDX_BY_RANK[j]
 
     i = _row("We take the closest bolts having a > a'")
     with i:
@@ -335,16 +423,19 @@ def render_dc005a():
             unsafe_allow_html=True
         )
 
-    # Persist for downstream use
-    st.session_state["dc005a"] = {
-        "G_mm": G, "Gstem_mm": Gstem,
-        "Pa_test_MPa": Pa_test, "Pe_MPa": Pe,
-        "material": mat, "Syb_MPa": Syb, "S_MPa": S,
-        "ring_area_mm2": ring_area, "H_N": H, "Wm1_N": Wm1,
-        "Am_mm2": Am, "a_req_each_mm2": a_req, "n": n,
-        "bolt_size": bolt_size, "a_mm2": a, "Ab_mm2": Ab,
-        "Sa_eff_MPa": Sa_eff, "verdict": verdict
-    }
+    # Persist for downstream use — only when an input actually changed
+    input_key = (G, Gstem, Pa_test, Pe, mat, Syb, S, n, bolt_size)
+    if st.session_state.get("_dc005a_key") != input_key or "dc005a" not in st.session_state:
+        st.session_state["_dc005a_key"] = input_key
+        st.session_state["dc005a"] = {
+            "G_mm": G, "Gstem_mm": Gstem,
+            "Pa_test_MPa": Pa_test, "Pe_MPa": Pe,
+            "material": mat, "Syb_MPa": Syb, "S_MPa": S,
+            "ring_area_mm2": ring_area, "H_N": H, "Wm1_N": Wm1,
+            "Am_mm2": Am, "a_req_each_mm2": a_req, "n": n,
+            "bolt_size": bolt_size, "a_mm2": a, "Ab_mm2": Ab,
+            "Sa_eff_MPa": Sa_eff, "verdict": verdict
+        }
 
     # ───────────────────────── Save / Load (backend) ──────────────────────────
     st.markdown("---")
@@ -384,6 +475,7 @@ def render_dc005a():
         if st.button("💾 Save DC005A", type="primary", key="dc005a_btn_save", use_container_width=True):
             try:
                 new_id = create_dc005a_calc(user_id, save_name, payload, design_id=st.session_state.get("active_design_id"))
+                _cached_list_dc005a.clear()
                 st.success(f"Saved ✔ (ID: {new_id[:8]}…)")
             except Exception as e:
                 st.error(f"Save failed: {e}")
@@ -409,15 +501,12 @@ def render_dc005a():
         return out
 
     with colR:
-        items_raw = list_dc005a_calcs(user_id)
+        items_raw = _cached_list_dc005a(user_id)
         items = _normalize_dc005a_list(items_raw)
         if not items:
             st.info("No DC005A saves yet.")
         else:
-            label_to_id = {
-                f"{nm} ({_id[:8]}…) • Created: {_fmt_dt(ca)} • Updated: {_fmt_dt(ua)}": _id
-                for (_id, nm, ca, ua) in items
-            }
+            label_to_id = _build_label_map(tuple(items))
             picked = st.selectbox("My DC005A saves", ["-- none --", *label_to_id.keys()], key="dc005a_pick")
             if picked != "-- none --":
                 sel_id = label_to_id[picked]
@@ -427,9 +516,11 @@ def render_dc005a():
                 ins_s   = rec.get("inputs") or {}
                 comp_s  = rec.get("computed") or {}
 
-                created_at = next((ca for (_i, _n, ca, _u) in items if _i == sel_id), None)
-                updated_at = next((ua for (_i, _n, _c, ua) in items if _i == sel_id), None)
-                name_guess = next((nm for (_i, nm, _c, _u) in items if _i == sel_id), None)
+                # name + timestamps come back in the same SELECT as the payload
+                meta = rec.get("_meta") or {}
+                created_at = meta.get("created_at")
+                updated_at = meta.get("updated_at")
+                name_guess = meta.get("name")
 
                 st.caption(
                     f"Name: **{(name_guess or 'DC005A')}** • "
@@ -438,41 +529,38 @@ def render_dc005a():
                 )
 
                 st.markdown("#### Summary (Prettified)")
-                st.markdown("**Base (from Valve Data)**")
-                st.table(pd.DataFrame([
-                    ["Valve design name", base_s.get("valve_design_name")],
-                    ["Valve design ID",   base_s.get("valve_design_id")],
-                    ["NPS [in]",          base_s.get("nps_in")],
-                    ["ASME Class",        base_s.get("asme_class")],
-                    ["Bore (base) [mm]",  base_s.get("bore_diameter_mm")],
-                    ["Po (base) [MPa]",   base_s.get("operating_pressure_mpa")],
-                ], columns=["Field", "Value"]))
-
-                st.markdown("**Inputs**")
-                st.table(pd.DataFrame([
-                    ["G [mm]", ins_s.get("G_mm")],
-                    ["Gstem [mm]", ins_s.get("Gstem_mm")],
-                    ["Pa_test [MPa]", ins_s.get("Pa_test_MPa")],
-                    ["Pe [MPa]", ins_s.get("Pe_MPa")],
-                    ["Bolt material", ins_s.get("material")],
-                    ["Syb [MPa]", ins_s.get("Syb_MPa")],
-                    ["S [MPa]", ins_s.get("S_MPa")],
-                    ["Bolts number n", ins_s.get("n")],
-                    ["Bolt size", ins_s.get("bolt_size")],
-                    ["a (per bolt) [mm²]", ins_s.get("a_mm2")],
-                ], columns=["Field", "Value"]))
-
-                st.markdown("**Computed**")
-                st.table(pd.DataFrame([
-                    ["Ring area [mm²]", comp_s.get("ring_area_mm2")],
-                    ["H [N]", comp_s.get("H_N")],
-                    ["Wm1 [N]", comp_s.get("Wm1_N")],
-                    ["Am [mm²]", comp_s.get("Am_mm2")],
-                    ["a' each req. [mm²]", comp_s.get("a_req_each_mm2")],
-                    ["Ab [mm²]", comp_s.get("Ab_mm2")],
-                    ["Sa_eff [MPa]", comp_s.get("Sa_eff_MPa")],
-                    ["Check", comp_s.get("verdict")],
-                ], columns=["Field", "Value"]))
+                st.markdown(_kv_html((
+                    ("Base (from Valve Data)", (
+                        ("Valve design name", base_s.get("valve_design_name")),
+                        ("Valve design ID",   base_s.get("valve_design_id")),
+                        ("NPS [in]",          base_s.get("nps_in")),
+                        ("ASME Class",        base_s.get("asme_class")),
+                        ("Bore (base) [mm]",  base_s.get("bore_diameter_mm")),
+                        ("Po (base) [MPa]",   base_s.get("operating_pressure_mpa")),
+                    )),
+                    ("Inputs", (
+                        ("G [mm]", ins_s.get("G_mm")),
+                        ("Gstem [mm]", ins_s.get("Gstem_mm")),
+                        ("Pa_test [MPa]", ins_s.get("Pa_test_MPa")),
+                        ("Pe [MPa]", ins_s.get("Pe_MPa")),
+                        ("Bolt material", ins_s.get("material")),
+                        ("Syb [MPa]", ins_s.get("Syb_MPa")),
+                        ("S [MPa]", ins_s.get("S_MPa")),
+                        ("Bolts number n", ins_s.get("n")),
+                        ("Bolt size", ins_s.get("bolt_size")),
+                        ("a (per bolt) [mm²]", ins_s.get("a_mm2")),
+                    )),
+                    ("Computed", (
+                        ("Ring area [mm²]", comp_s.get("ring_area_mm2")),
+                        ("H [N]", comp_s.get("H_N")),
+                        ("Wm1 [N]", comp_s.get("Wm1_N")),
+                        ("Am [mm²]", comp_s.get("Am_mm2")),
+                        ("a' each req. [mm²]", comp_s.get("a_req_each_mm2")),
+                        ("Ab [mm²]", comp_s.get("Ab_mm2")),
+                        ("Sa_eff [MPa]", comp_s.get("Sa_eff_MPa")),
+                        ("Check", comp_s.get("verdict")),
+                    )),
+                )), unsafe_allow_html=True)
 
                 # ---------- Actions ----------
                 r1, r2, r3 = st.columns(3)
@@ -480,6 +568,7 @@ def render_dc005a():
                     newname = st.text_input("Rename", value=(name_guess or "DC005A"), key=f"dc005a_rename_{sel_id}")
                     if st.button("💾 Save name", key=f"dc005a_btn_rename_{sel_id}", use_container_width=True):
                         if update_dc005a_calc(sel_id, user_id, name=newname):
+                            _cached_list_dc005a.clear()
                             st.success("Renamed.")
                             st.rerun()
                         else:
@@ -487,6 +576,7 @@ def render_dc005a():
                 with r2:
                     if st.button("🗑️ Delete", key=f"dc005a_btn_delete_{sel_id}", use_container_width=True):
                         if delete_dc005a_calc(sel_id, user_id):
+                            _cached_list_dc005a.clear()
                             st.success("Deleted.")
                             st.rerun()
                         else:
@@ -505,7 +595,10 @@ def render_dc005a():
                         st.session_state["dc005a_Syb"]   = ins_s.get("Syb_MPa", st.session_state.get("dc005a_Syb"))
                         S_loaded = ins_s.get("S_MPa", st.session_state.get("dc005a_Syb", 0)*0.83 if st.session_state.get("dc005a_Syb") else None)
                         if S_loaded is not None:
-                            st.session_state[f"dc005a_S_for_{float(S_loaded):.1f}"] = S_loaded
+                            st.session_state["dc005a_S"] = float(S_loaded)
+                            if st.session_state.get("dc005a_Syb") is not None:
+                                # keep the loaded S from being re-seeded off the loaded Syb
+                                st.session_state["_dc005a_S_default"] = round(0.83 * float(st.session_state["dc005a_Syb"]), 1)
                         st.session_state["dc005a_n"]     = ins_s.get("n", st.session_state.get("dc005a_n"))
                         # bolt size select
                         if isinstance(ins_s.get("bolt_size"), str) and ins_s["bolt_size"] in BOLT_TENSILE_AREAS_MM2:
@@ -516,6 +609,7 @@ def render_dc005a():
                         st.session_state["valve_nps"]              = base_s.get("nps_in") or st.session_state.get("valve_nps")
                         st.session_state["valve_asme_class"]       = base_s.get("asme_class") or st.session_state.get("valve_asme_class")
                         st.session_state["bore_diameter_mm"]       = base_s.get("bore_diameter_mm") or st.session_state.get("bore_diameter_mm")
+                        st.session_state.pop("_dc005a_seeded", None)
 
                         st.success("Loaded into session.")
                         st.rerun()
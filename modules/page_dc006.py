@@ -1,12 +1,14 @@
 # page_dc006.py
 from __future__ import annotations
-import math, os
-from typing import List, Any, Dict, Optional, Tuple
-from PIL import Image
+import html, math, os
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Any, Dict, NamedTuple, Optional, Tuple
 import streamlit as st
-import pandas as pd
 from datetime import datetime
 
+if TYPE_CHECKING:  # PIL is imported lazily, only when the sketch is decoded
+    from PIL import Image
+
 # ── Auth + wizard base
 from auth import require_role, current_user
 from valve_repo import list_valve_designs, get_valve_design
@@ -25,6 +27,10 @@ GASKETS = {
     "Non-asb.": {"m": 2.5, "y": 7.0},
 }
 
+# (m, y) per gasket, normalized to floats once at import
+_GASKETS_MY: Dict[str, Tuple[float, float]] = {k: (float(d["m"]), float(d["y"])) for k, d in GASKETS.items()}
+_GASKET_NAMES: List[str] = list(GASKETS.keys())
+
 # ──────────────────────────────────────────────────────────────────────────────
 # CSS + layout helpers (labels left, fields right)
 _ROW_CSS = """
@@ -35,6 +41,10 @@ _ROW_CSS = """
   font-weight:600; color:#0f172a; white-space:nowrap; padding:0 .5rem;
 }
 .row-input{ display:flex; align-items:center; }
+.row-value{
+  height:40px; display:flex; align-items:center; padding:0 .7rem; margin-bottom:1rem;
+  border-radius:.5rem; background:rgba(151,166,195,.15); color:rgba(49,51,63,.6);
+}
 .stTextInput > div > div > input,
 .stNumberInput > div > div > input{ height:40px !important; padding:0 .7rem !important; }
 .stSelectbox > div > div{ min-height:40px !important; }
@@ -42,36 +52,63 @@ _ROW_CSS = """
 .badge{ padding:.35rem .8rem; border-radius:.5rem; color:#fff; font-weight:800; letter-spacing:.3px; display:inline-block; }
 .badge.ok{ background:#22c55e; }
 .badge.bad{ background:#ef4444; }
+.kv{ width:100%; border-collapse:collapse; margin-bottom:1rem; }
+.kv td, .kv th{ padding:.35rem .6rem; border-bottom:1px solid rgba(49,51,63,.1); text-align:left; }
+.kv td:first-child{ font-weight:600; color:#0f172a; width:45%; }
+.kv tr.kv-sec th{ padding-top:.8rem; font-weight:800; border-bottom:2px solid rgba(49,51,63,.2); }
 </style>
 """
 
 def _css():
+    # Not guarded by a session flag: styles only persist while each run re-emits them
+    # (same reasoning as page_dc003._css).
     st.markdown(_ROW_CSS, unsafe_allow_html=True)
 
+_ROW_TMPL = "<div class='row-label'>%s</div>"
+
+@lru_cache(maxsize=64)
+def _row_html(label: str) -> str:
+    # labels are a small fixed set: build each HTML snippet once per process
+    return _ROW_TMPL % label
+
 def _row(label: str):
     c1, c2 = st.columns([1.25, 2.25])
     with c1:
-        st.markdown(f"<div class='row-label'>{label}</div>", unsafe_allow_html=True)
+        st.markdown(_row_html(label), unsafe_allow_html=True)
     return c2
 
 def _out_calc(key: str, value, fmt: str = "{}"):
-    s = fmt.format(value) if value is not None else ""
-    st.session_state[key] = s  # keep widget synced to current value
-    st.text_input("", key=key, disabled=True, label_visibility="collapsed")
+    """
+    Read-only value box styled like a disabled input — one markdown element,
+    no widget and no session_state write per computed output.
+    """
+    s = html.escape(fmt.format(value)) if value is not None else ""
+    st.markdown(f"<div class='row-value' id='{key}'>{s}</div>", unsafe_allow_html=True)
+
+# Resolved once at import; the flange sketch is a static bundled asset
+_FLANGE_PATH = next(
+    (p for p in ("dc006_flange.png", "assets/dc006_flange.png", "static/dc006_flange.png") if os.path.exists(p)),
+    None,
+)
+
+@st.cache_resource(show_spinner=False)
+def _load_flange_img(path: str, size_px: int) -> Image.Image:
+    # decode + Lanczos resample once per process, shared across reruns
+    from PIL import Image
+    return Image.open(path).convert("RGBA").resize((size_px, size_px), Image.LANCZOS)
 
 def _img(container, size_px: int = 300):
-    for p in ["dc006_flange.png", "assets/dc006_flange.png", "static/dc006_flange.png"]:
-        if os.path.exists(p):
-            try:
-                img = Image.open(p).convert("RGBA").resize((size_px, size_px), Image.LANCZOS)
-                with container:
-                    st.image(img, caption="Flange / gasket geometry", use_column_width=False)
-            except Exception as e:
-                with container:
-                    st.warning(f"Could not load DC006 image ({e}).")
-            return
-    with container:
-        st.info("Add **dc006_flange.png** (or put it in ./assets/ or ./static/) to display the drawing.")
+    if _FLANGE_PATH is None:
+        with container:
+            st.info("Add **dc006_flange.png** (or put it in ./assets/ or ./static/) to display the drawing.")
+        return
+    try:
+        img = _load_flange_img(_FLANGE_PATH, size_px)
+        with container:
+            st.image(img, caption="Flange / gasket geometry", use_column_width=False)
+    except Exception as e:
+        with container:
+            st.warning(f"Could not load DC006 image ({e}).")
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Wizard hydration helpers (same pattern as other pages)
@@ -89,6 +126,14 @@ def _normalize_first_pair(rows: List[Any]) -> Tuple[Optional[str], Optional[str]
         rid = first
     return (str(rid) if rid else None, str(nm) if nm else None)
 
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_list_valve_designs(uid: str, limit: int = 1):
+    return list_valve_designs(uid, limit=limit)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_get_valve_design(vid: str, uid: str) -> Dict[str, Any]:
+    return get_valve_design(vid, uid) or {}
+
 def _seed_base_from_valve(user_id: Optional[str]):
     # 1) hydrate from wizard if locked
     if is_locked():
@@ -112,10 +157,10 @@ def _seed_base_from_valve(user_id: Optional[str]):
     if not user_id:
         return
     try:
-        rows = list_valve_designs(user_id, limit=1)
+        rows = _cached_list_valve_designs(user_id, limit=1)
         vid, vname = _normalize_first_pair(rows)
         if not vid: return
-        vdata = get_valve_design(vid, user_id) or {}
+        vdata = _cached_get_valve_design(vid, user_id)
         vcalc = vdata.get("calculated") or {}
 
         st.session_state.setdefault("valve_nps", vdata.get("nps_in"))
@@ -130,24 +175,115 @@ def _seed_base_from_valve(user_id: Optional[str]):
     except Exception:
         pass
 
+_DT_FORMATS = ("%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%d %H:%M:%S.%f", "%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S")
+
 def _fmt_dt(x: Any) -> str:
     if not x: return "—"
+    if isinstance(x, datetime):
+        return x.strftime("%Y-%m-%d %H:%M")
+    base = str(x)[:26]
+    # C-level ISO parser first; the strptime loop only handles odd shapes
     try:
-        base = str(x)[:26]
-        for fmt in ("%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%d %H:%M:%S.%f", "%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S"):
-            try:
-                return datetime.strptime(base, fmt).strftime("%Y-%m-%d %H:%M")
-            except Exception:
-                pass
-    except Exception:
+        return datetime.fromisoformat(base).strftime("%Y-%m-%d %H:%M")
+    except ValueError:
         pass
+    for fmt in _DT_FORMATS:
+        try:
+            return datetime.strptime(base, fmt).strftime("%Y-%m-%d %H:%M")
+        except ValueError:
+            pass
     return str(x)[:16]
 
+def _kv_html(sections: Tuple[Tuple[str, Tuple[Tuple[str, Any], ...]], ...]) -> str:
+    """
+    Saved-record summary as one HTML Field/Value table (a header row per section),
+    emitted as a single markdown element — no DataFrame/Arrow round-trip.
+    """
+    parts: List[str] = []
+    for title, pairs in sections:
+        parts.append(f"<tr class='kv-sec'><th colspan='2'>{html.escape(title)}</th></tr>")
+        parts.extend(
+            f"<tr><td>{html.escape(k)}</td><td>{'' if v is None else html.escape(str(v))}</td></tr>"
+            for k, v in pairs
+        )
+    return "<table class='kv'>" + "".join(parts) + "</table>"
+
+# ──────────────────────────────────────────────────────────────────────────────
+# DC006 numeric kernel (pure; floats in → hashable, so unchanged inputs are a cache hit)
+_PI = math.pi
+_PI_4 = math.pi * 0.25
+_2_OVER_PI = 2.0 / math.pi
+
+class _DC006Result(NamedTuple):
+    N: float
+    b0: float
+    b: float
+    G: float
+    H: float
+    Hp: float
+    Wm1: float
+    Wm2: float
+    K: float
+    Sf1: float
+    Sf2: float
+    Sf: float
+
+@lru_cache(maxsize=256)
+def _compute_dc006(Pa: float, FT: float, ISGD: float, Bcd: float, ESGD: float, m: float, y: float) -> _DC006Result:
+    N  = (ESGD - ISGD) / 2.0
+    b0 = N / 2.0
+    b  = b0
+    G  = ESGD - 2.0 * b
+
+    H  = _PI_4 * G * G * Pa
+    Hp = 2.0 * b * _PI * G * m * Pa
+    Wm1 = H + Hp
+
+    Wm2 = _PI * b * G * y
+
+    bcd = Bcd if Bcd > 1e-9 else 1e-9
+    ft  = FT if FT > 1e-9 else 1e-9
+    ft2 = ft * ft                      # shared by both Sf terms
+    K = _2_OVER_PI * (1.0 - 0.67 * ESGD / bcd)
+    Sf1 = K * Wm1 / ft2
+    Sf2 = K * Wm2 / ft2
+    Sf  = Sf1 if Sf1 >= Sf2 else Sf2
+    return _DC006Result(N, b0, b, G, H, Hp, Wm1, Wm2, K, Sf1, Sf2, Sf)
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Save list (normalized + cached per user; cleared on save/rename/delete)
+def _normalize_dc006_list(rows: List[Any]) -> List[Tuple[str, str, Any, Any]]:
+    out: List[Tuple[str, str, Any, Any]] = []
+    for r in rows or []:
+        rid, nm, ca, ua = None, "Untitled", None, None
+        if isinstance(r, (list, tuple)):
+            if len(r) >= 1: rid = r[0]
+            if len(r) >= 2 and r[1] not in (None, ""): nm = r[1]
+            if len(r) >= 3: ca = r[2]
+            if len(r) >= 4: ua = r[3]
+        elif isinstance(r, dict):
+            rid = r.get("id") or r.get("calc_id") or r.get("id_")
+            nm  = r.get("name") or nm
+            ca  = r.get("created_at")
+            ua  = r.get("updated_at")
+        elif isinstance(r, str):
+            rid = r
+        if rid:
+            out.append((str(rid), str(nm), ca, ua))
+    return out
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_list_dc006(uid: str) -> List[Tuple[str, str, Any, Any]]:
+    return _normalize_dc006_list(list_dc006_calcs(uid))
+
 # ──────────────────────────────────────────────────────────────────────────────
 def render_dc006():
     """
     DC006 — Flange Stress Calculation ASME VIII Div.1 App.2
     """
+    # Both calls are session-cached already (current_user() only validates the
+    # URL token when session_state["user"] is empty). The role check stays live
+    # every run so a logout or user switch is honoured immediately.
     require_role(["user", "superadmin"])
     user = current_user() or {}
     user_id = user.get("id")
@@ -173,47 +309,54 @@ def render_dc006():
     # ── Inputs
     Pa_default = float(st.session_state.get("operating_pressure_mpa", 10.21))
 
-    i = _row("Design pressure at ambient temperature  Pa  [MPa]")
-    with i:
-        Pa  = st.number_input("", value=Pa_default, step=0.01, format="%.2f",
-                              key="dc006_Pa", label_visibility="collapsed")
-
-    i = _row("Flange thickness  FT  [mm]")
-    with i:
-        FT  = st.number_input("", value=23.0, step=0.1, format="%.1f",
-                              key="dc006_FT", label_visibility="collapsed")
-
-    i = _row("Internal Seal Gasket Diameter  ISGD  [mm]")
-    with i:
-        ISGD = st.number_input("", value=113.9, step=0.1, format="%.1f",
-                               key="dc006_ISGD", label_visibility="collapsed")
-
-    i = _row("Bolt circle diameter  Bcd  [mm]")
-    with i:
-        Bcd = st.number_input("", value=142.0, step=0.1, format="%.1f",
-                              key="dc006_Bcd", label_visibility="collapsed")
-
-    i = _row("External Seal Gasket Diameter  ESGD  [mm]")
-    with i:
-        ESGD = st.number_input("", value=122.7, step=0.1, format="%.1f",
-                               key="dc006_ESGD", label_visibility="collapsed")
-
-    i = _row("Gasket type")
-    with i:
-        gasket_names: List[str] = list(GASKETS.keys())
-        gasket = st.selectbox("", options=gasket_names,
-                              index=gasket_names.index("GRAPHITE"),
-                              key="dc006_gasket", label_visibility="collapsed")
-
-    i = _row("Gasket factor  m  [−]")
-    with i:
-        m = st.number_input("", value=float(GASKETS[gasket]["m"]), step=0.1, format="%.1f",
-                            key="dc006_m", label_visibility="collapsed")
-
-    i = _row("Gasket unit seating load  y  [MPa]")
-    with i:
-        y = st.number_input("", value=float(GASKETS[gasket]["y"]), step=0.1, format="%.1f",
-                            key="dc006_y", label_visibility="collapsed")
+    # One form for the input block: edits are applied together on "Recalculate"
+    # instead of rerunning the whole page on every keystroke.
+    with st.form("dc006_inputs", clear_on_submit=False, border=False):
+        i = _row("Design pressure at ambient temperature  Pa  [MPa]")
+        with i:
+            Pa  = st.number_input("", value=Pa_default, step=0.01, format="%.2f",
+                                  key="dc006_Pa", label_visibility="collapsed")
+
+        i = _row("Flange thickness  FT  [mm]")
+        with i:
+            FT  = st.number_input("", value=23.0, step=0.1, format="%.1f",
+                                  key="dc006_FT", label_visibility="collapsed")
+
+        i = _row("Internal Seal Gasket Diameter  ISGD  [mm]")
+        with i:
+            ISGD = st.number_input("", value=113.9, step=0.1, format="%.1f",
+                                   key="dc006_ISGD", label_visibility="collapsed")
+
+        i = _row("Bolt circle diameter  Bcd  [mm]")
+        with i:
+            Bcd = st.number_input("", value=142.0, step=0.1, format="%.1f",
+                                  key="dc006_Bcd", label_visibility="collapsed")
+
+        i = _row("External Seal Gasket Diameter  ESGD  [mm]")
+        with i:
+            ESGD = st.number_input("", value=122.7, step=0.1, format="%.1f",
+                                   key="dc006_ESGD", label_visibility="collapsed")
+
+        i = _row("Gasket type")
+        with i:
+            gasket = st.selectbox("", options=_GASKET_NAMES,
+                                  index=_GASKET_NAMES.index("GRAPHITE"),
+                                  key="dc006_gasket", label_visibility="collapsed")
+            m_def, y_def = _GASKETS_MY[gasket]
+
+        i = _row("Gasket factor  m  [−]")
+        with i:
+            m = st.number_input("", value=m_def, step=0.1, format="%.1f",
+                                key="dc006_m", label_visibility="collapsed")
+
+        i = _row("Gasket unit seating load  y  [MPa]")
+        with i:
+            y = st.number_input("", value=y_def, step=0.1, format="%.1f",
+                                key="dc006_y", label_visibility="collapsed")
+
+        i = _row("")
+        with i:
+            st.form_submit_button("Recalculate")
 
     # Image
     i = _row("Sketch")
@@ -221,10 +364,10 @@ def render_dc006():
 
     st.markdown("### GASKET LOAD REACTION DIAMETER CALCULATION G (ASME VIII DIV.1 APP.2)")
 
-    N  = (ESGD - ISGD) / 2.0
-    b0 = N / 2.0
-    b  = b0
-    G  = ESGD - 2.0 * b
+    r = _compute_dc006(float(Pa), float(FT), float(ISGD), float(Bcd), float(ESGD), float(m), float(y))
+    N, b0, b, G = r.N, r.b0, r.b, r.G
+    H, Hp, Wm1, Wm2 = r.H, r.Hp, r.Wm1, r.Wm2
+    K, Sf1, Sf2, Sf = r.K, r.Sf1, r.Sf2, r.Sf
 
     i = _row("Gasket width  N  [mm] = (ESGD − ISGD) / 2")
     with i: _out_calc("dc006_out_N",  N,  "{:.2f}")
@@ -240,10 +383,6 @@ def render_dc006():
 
     st.markdown("### FLANGE LOAD IN OPERATING CONDITION  Wm1  (ASME VIII DIV.1 APP.2)")
 
-    H  = (math.pi/4.0) * (G**2) * Pa
-    Hp = 2.0 * b * math.pi * G * m * Pa
-    Wm1 = H + Hp
-
     i = _row("Hydrostatic end force  H  [N] = π/4 × G² × Pa")
     with i: _out_calc("dc006_out_H",  H,  "{:,.2f}")
 
@@ -255,18 +394,11 @@ def render_dc006():
 
     st.markdown("### FLANGE LOAD IN GASKET SEATING CONDITION  Wm2  (ASME VIII DIV.1 APP.2)")
 
-    Wm2 = math.pi * b * G * y
-
     i = _row("Min. initial required bolt load  Wm2  [N] = π × b × G × y")
     with i: _out_calc("dc006_out_Wm2", Wm2, "{:,.2f}")
 
     st.markdown("### CLOSURE FLANGE STRESS CALCULATION  Sf")
 
-    K = (2.0 / math.pi) * (1.0 - 0.67 * ESGD / max(Bcd, 1e-9))
-    Sf1 = K * Wm1 / max(FT, 1e-9)**2
-    Sf2 = K * Wm2 / max(FT, 1e-9)**2
-    Sf  = max(Sf1, Sf2)
-
     i = _row("Operating condition at ambient temperature  Sf₁  [MPa] = (2/π)·(1−0.67·ESGD/Bcd)·Wm1/FT²")
     with i: _out_calc("dc006_out_Sf1", Sf1, "{:.2f}")
 
@@ -313,68 +445,56 @@ def render_dc006():
         st.info("Log in to save your DC006 calculations.")
         return
 
-    # Build payload (Base + Inputs + Computed)
-    base_payload: Dict[str, Any] = {
-        "valve_design_id":   st.session_state.get("active_design_id"),
-        "valve_design_name": st.session_state.get("active_design_name"),
-        "nps_in":            st.session_state.get("valve_nps"),
-        "asme_class":        st.session_state.get("valve_asme_class"),
-        "bore_diameter_mm":  st.session_state.get("bore_diameter_mm"),
-        "operating_pressure_mpa": st.session_state.get("operating_pressure_mpa"),
-    }
-    inputs_payload: Dict[str, Any] = {
-        "Pa_MPa": Pa, "FT_mm": FT, "ISGD_mm": ISGD, "Bcd_mm": Bcd, "ESGD_mm": ESGD,
-        "gasket": gasket, "m": m, "y_MPa": y
-    }
-    computed_payload: Dict[str, Any] = {
-        "N_mm": N, "b0_mm": b0, "b_mm": b, "G_mm": G,
-        "H_N": H, "Hp_N": Hp, "Wm1_N": Wm1, "Wm2_N": Wm2,
-        "K": K, "Sf1_MPa": Sf1, "Sf2_MPa": Sf2, "Sf_MPa": Sf,
-        "allow_MPa": allow, "verdict": verdict
-    }
-    payload: Dict[str, Any] = {"base": base_payload, "inputs": inputs_payload, "computed": computed_payload}
-
     colL, colR = st.columns([1.2, 1.8])
     with colL:
         default_name = f"DC006_{st.session_state.get('active_design_name') or 'calc'}"
         save_name = st.text_input("Save as name", value=default_name, key="dc006_save_name")
         if st.button("💾 Save DC006", type="primary", key="dc006_btn_save", use_container_width=True):
-            try:
-                new_id = create_dc006_calc(user_id, save_name, payload, design_id=st.session_state.get("active_design_id"))
-                st.success(f"Saved ✔ (ID: {new_id[:8]}…)")
-            except Exception as e:
-                st.error(f"Save failed: {e}")
-
-    def _normalize_dc006_list(rows: List[Any]) -> List[Tuple[str, str, Any, Any]]:
-        out: List[Tuple[str, str, Any, Any]] = []
-        for r in rows or []:
-            rid, nm, ca, ua = None, "Untitled", None, None
-            if isinstance(r, (list, tuple)):
-                if len(r) >= 1: rid = r[0]
-                if len(r) >= 2 and r[1] not in (None, ""): nm = r[1]
-                if len(r) >= 3: ca = r[2]
-                if len(r) >= 4: ua = r[3]
-            elif isinstance(r, dict):
-                rid = r.get("id") or r.get("calc_id") or r.get("id_")
-                nm  = r.get("name") or nm
-                ca  = r.get("created_at")
-                ua  = r.get("updated_at")
-            elif isinstance(r, str):
-                rid = r
-            if rid:
-                out.append((str(rid), str(nm), ca, ua))
-        return out
+            base_payload: Dict[str, Any] = {
+                "valve_design_id":   st.session_state.get("active_design_id"),
+                "valve_design_name": st.session_state.get("active_design_name"),
+                "nps_in":            st.session_state.get("valve_nps"),
+                "asme_class":        st.session_state.get("valve_asme_class"),
+                "bore_diameter_mm":  st.session_state.get("bore_diameter_mm"),
+                "operating_pressure_mpa": st.session_state.get("operating_pressure_mpa"),
+            }
+            # Same base + inputs + name as the last successful save → nothing to write
+            # (the computed block is a pure function of these, so they cover the payload)
+            save_key = (tuple(base_payload.values()), Pa, FT, ISGD, Bcd, ESGD, gasket, m, y, allow, save_name)
+            if st.session_state.get("dc006_last_saved_key") == save_key:
+                st.info("No changes since the last save — nothing written.")
+            else:
+                # Rest of the payload (Inputs + Computed)
+                inputs_payload: Dict[str, Any] = {
+                    "Pa_MPa": Pa, "FT_mm": FT, "ISGD_mm": ISGD, "Bcd_mm": Bcd, "ESGD_mm": ESGD,
+                    "gasket": gasket, "m": m, "y_MPa": y
+                }
+                computed_payload: Dict[str, Any] = {
+                    "N_mm": N, "b0_mm": b0, "b_mm": b, "G_mm": G,
+                    "H_N": H, "Hp_N": Hp, "Wm1_N": Wm1, "Wm2_N": Wm2,
+                    "K": K, "Sf1_MPa": Sf1, "Sf2_MPa": Sf2, "Sf_MPa": Sf,
+                    "allow_MPa": allow, "verdict": verdict
+                }
+                payload: Dict[str, Any] = {"base": base_payload, "inputs": inputs_payload, "computed": computed_payload}
+                try:
+                    new_id = create_dc006_calc(user_id, save_name, payload, design_id=st.session_state.get("active_design_id"))
+                    st.session_state["dc006_last_saved_key"] = save_key
+                    _cached_list_dc006.clear()
+                    st.success(f"Saved ✔ (ID: {new_id[:8]}…)")
+                except Exception as e:
+                    st.error(f"Save failed: {e}")
 
     with colR:
-        items_raw = list_dc006_calcs(user_id)
-        items = _normalize_dc006_list(items_raw)
+        items = _cached_list_dc006(user_id)
         if not items:
             st.info("No DC006 saves yet.")
         else:
-            label_to_id = {
-                f"{nm} ({_id[:8]}…) • Created: {_fmt_dt(ca)} • Updated: {_fmt_dt(ua)}": _id
-                for (_id, nm, ca, ua) in items
-            }
+            # one pass over the saves: selector labels + per-id meta for the Load panel
+            label_to_id: Dict[str, str] = {}
+            id_to_meta: Dict[str, Tuple[str, Any, Any]] = {}
+            for (_id, nm, ca, ua) in items:
+                label_to_id[f"{nm} ({_id[:8]}…) • Created: {_fmt_dt(ca)} • Updated: {_fmt_dt(ua)}"] = _id
+                id_to_meta[_id] = (nm, ca, ua)
             picked = st.selectbox("My DC006 saves", ["-- none --", *label_to_id.keys()], key="dc006_pick")
             if picked != "-- none --":
                 sel_id = label_to_id[picked]
@@ -384,9 +504,7 @@ def render_dc006():
                 ins_s   = rec.get("inputs") or {}
                 comp_s  = rec.get("computed") or {}
 
-                created_at = next((ca for (_i, _n, ca, _u) in items if _i == sel_id), None)
-                updated_at = next((ua for (_i, _n, _c, ua) in items if _i == sel_id), None)
-                name_guess = next((nm for (_i, nm, _c, _u) in items if _i == sel_id), None)
+                name_guess, created_at, updated_at = id_to_meta.get(sel_id, (None, None, None))
 
                 st.caption(
                     f"Name: **{(name_guess or 'DC006')}** • "
@@ -395,45 +513,42 @@ def render_dc006():
                 )
 
                 st.markdown("#### Summary (Prettified)")
-                st.markdown("**Base (from Valve Data)**")
-                st.table(pd.DataFrame([
-                    ["Valve design name", base_s.get("valve_design_name")],
-                    ["Valve design ID",   base_s.get("valve_design_id")],
-                    ["NPS [in]",          base_s.get("nps_in")],
-                    ["ASME Class",        base_s.get("asme_class")],
-                    ["Bore (base) [mm]",  base_s.get("bore_diameter_mm")],
-                    ["Po (base) [MPa]",   base_s.get("operating_pressure_mpa")],
-                ], columns=["Field", "Value"]))
-
-                st.markdown("**Inputs**")
-                st.table(pd.DataFrame([
-                    ["Pa [MPa]", ins_s.get("Pa_MPa")],
-                    ["FT [mm]", ins_s.get("FT_mm")],
-                    ["ISGD [mm]", ins_s.get("ISGD_mm")],
-                    ["Bcd [mm]", ins_s.get("Bcd_mm")],
-                    ["ESGD [mm]", ins_s.get("ESGD_mm")],
-                    ["Gasket", ins_s.get("gasket")],
-                    ["m [-]", ins_s.get("m")],
-                    ["y [MPa]", ins_s.get("y_MPa")],
-                ], columns=["Field", "Value"]))
-
-                st.markdown("**Computed**")
-                st.table(pd.DataFrame([
-                    ["N [mm]", comp_s.get("N_mm")],
-                    ["b0 [mm]", comp_s.get("b0_mm")],
-                    ["b [mm]", comp_s.get("b_mm")],
-                    ["G [mm]", comp_s.get("G_mm")],
-                    ["H [N]", comp_s.get("H_N")],
-                    ["Hp [N]", comp_s.get("Hp_N")],
-                    ["Wm1 [N]", comp_s.get("Wm1_N")],
-                    ["Wm2 [N]", comp_s.get("Wm2_N")],
-                    ["K [-]", comp_s.get("K")],
-                    ["Sf1 [MPa]", comp_s.get("Sf1_MPa")],
-                    ["Sf2 [MPa]", comp_s.get("Sf2_MPa")],
-                    ["Sf [MPa]", comp_s.get("Sf_MPa")],
-                    ["Allowable [MPa]", comp_s.get("allow_MPa")],
-                    ["Check", comp_s.get("verdict")],
-                ], columns=["Field", "Value"]))
+                st.markdown(_kv_html((
+                    ("Base (from Valve Data)", (
+                        ("Valve design name", base_s.get("valve_design_name")),
+                        ("Valve design ID",   base_s.get("valve_design_id")),
+                        ("NPS [in]",          base_s.get("nps_in")),
+                        ("ASME Class",        base_s.get("asme_class")),
+                        ("Bore (base) [mm]",  base_s.get("bore_diameter_mm")),
+                        ("Po (base) [MPa]",   base_s.get("operating_pressure_mpa")),
+                    )),
+                    ("Inputs", (
+                        ("Pa [MPa]", ins_s.get("Pa_MPa")),
+                        ("FT [mm]", ins_s.get("FT_mm")),
+                        ("ISGD [mm]", ins_s.get("ISGD_mm")),
+                        ("Bcd [mm]", ins_s.get("Bcd_mm")),
+                        ("ESGD [mm]", ins_s.get("ESGD_mm")),
+                        ("Gasket", ins_s.get("gasket")),
+                        ("m [-]", ins_s.get("m")),
+                        ("y [MPa]", ins_s.get("y_MPa")),
+                    )),
+                    ("Computed", (
+                        ("N [mm]", comp_s.get("N_mm")),
+                        ("b0 [mm]", comp_s.get("b0_mm")),
+                        ("b [mm]", comp_s.get("b_mm")),
+                        ("G [mm]", comp_s.get("G_mm")),
+                        ("H [N]", comp_s.get("H_N")),
+                        ("Hp [N]", comp_s.get("Hp_N")),
+                        ("Wm1 [N]", comp_s.get("Wm1_N")),
+                        ("Wm2 [N]", comp_s.get("Wm2_N")),
+                        ("K [-]", comp_s.get("K")),
+                        ("Sf1 [MPa]", comp_s.get("Sf1_MPa")),
+                        ("Sf2 [MPa]", comp_s.get("Sf2_MPa")),
+                        ("Sf [MPa]", comp_s.get("Sf_MPa")),
+                        ("Allowable [MPa]", comp_s.get("allow_MPa")),
+                        ("Check", comp_s.get("verdict")),
+                    )),
+                )), unsafe_allow_html=True)
 
                 # ---------- Actions ----------
                 r1, r2, r3 = st.columns(3)
@@ -441,6 +556,7 @@ def render_dc006():
                     newname = st.text_input("Rename", value=(name_guess or "DC006"), key=f"dc006_rename_{sel_id}")
                     if st.button("💾 Save name", key=f"dc006_btn_rename_{sel_id}", use_container_width=True):
                         if update_dc006_calc(sel_id, user_id, name=newname):
+                            _cached_list_dc006.clear()
                             st.success("Renamed.")
                             st.rerun()
                         else:
@@ -448,6 +564,8 @@ def render_dc006():
                 with r2:
                     if st.button("🗑️ Delete", key=f"dc006_btn_delete_{sel_id}", use_container_width=True):
                         if delete_dc006_calc(sel_id, user_id):
+                            _cached_list_dc006.clear()
+                            st.session_state.pop("dc006_last_saved_key", None)  # allow re-saving the same inputs
                             st.success("Deleted.")
                             st.rerun()
                         else:
@@ -474,5 +592,6 @@ def render_dc006():
                         st.session_state["valve_asme_class"]       = base_s.get("asme_class") or st.session_state.get("valve_asme_class")
                         st.session_state["bore_diameter_mm"]       = base_s.get("bore_diameter_mm") or st.session_state.get("bore_diameter_mm")
 
+                        st.session_state.pop("dc006_last_saved_key", None)  # a re-save after Load always writes
                         st.success("Loaded into session.")
                         st.rerun()